@@ -4,37 +4,279 @@ Uses FFmpeg and OpenCV for video manipulation.
 """
 
 import os
-import json
+import re
+import csv
+import inspect
+import math
+import mmap
+import time
 import subprocess
 from pathlib import Path
 from typing import Any
-from datetime import datetime
+from functools import lru_cache, wraps
+from concurrent.futures import ThreadPoolExecutor
 
+import orjson
 from strands import tool
 
+try:
+    import av
+except ImportError:  # PyAV is optional; fall back to the ffprobe binary
+    av = None
+
 from app.config import get_settings, get_logger
 
 logger = get_logger("video_tools")
 settings = get_settings()
 
 
+# Directories this process has already created, so repeated tool calls skip
+# the makedirs syscalls.
+_created_dirs: set[str] = set()
+
+
+def _ensure_dir(directory: str) -> None:
+    """Create a directory once per process."""
+    if directory not in _created_dirs:
+        os.makedirs(directory, exist_ok=True)
+        _created_dirs.add(directory)
+
+
 def _run_ffprobe(video_path: str) -> dict:
-    """Run ffprobe to get video metadata."""
+    """
+    Run ffprobe to get video metadata.
+    
+    Results are memoized on (path, size, mtime), so a file that is probed
+    again by a later pipeline step is served from the cache, while a file
+    that has been rewritten is probed afresh.
+    """
+    st = os.stat(video_path)
+    return _ffprobe_cached(video_path, st.st_size, st.st_mtime_ns)
+
+
+@lru_cache(maxsize=256)
+def _ffprobe_cached(video_path: str, size: int, mtime_ns: int) -> dict:
+    """Probe a specific version of a file (see _run_ffprobe)."""
+    if av is not None:
+        try:
+            return _probe_with_av(video_path, size)
+        except Exception as e:
+            logger.debug("PyAV probe failed, using ffprobe", video_path=video_path, error=str(e))
+    return _probe_with_ffprobe(video_path)
+
+
+def _probe_with_av(video_path: str, size: int) -> dict:
+    """
+    Read container metadata in-process with PyAV (libavformat).
+    
+    Returns the same shape as ffprobe's JSON output for the fields listed in
+    _FFPROBE_ENTRIES.
+    """
+    with av.open(video_path) as container:
+        streams = []
+        for stream in container.streams:
+            info = {
+                "codec_type": stream.type,
+                "codec_name": stream.codec_context.name if stream.codec_context else None,
+            }
+            if stream.type == "video":
+                info["width"] = stream.codec_context.width
+                info["height"] = stream.codec_context.height
+                rate = stream.average_rate or stream.base_rate
+                info["r_frame_rate"] = f"{rate.numerator}/{rate.denominator}" if rate else "0/1"
+            streams.append(info)
+        
+        format_info = {
+            "format_name": container.format.name,
+            "size": size,
+        }
+        if container.duration is not None:
+            format_info["duration"] = container.duration / av.time_base
+        if container.bit_rate:
+            format_info["bit_rate"] = container.bit_rate
+    
+    return {"format": format_info, "streams": streams}
+
+
+# Only the fields the tools read; keeps ffprobe's output (and its parse) small.
+_FFPROBE_ENTRIES = (
+    "format=duration,size,bit_rate,format_name"
+    ":stream=codec_type,codec_name,width,height,r_frame_rate"
+)
+
+# Video codecs that MP4 segments and common players handle as-is; anything
+# else is re-encoded to H.264 when segmenting.
+_STREAM_COPY_CODECS = frozenset({"h264", "hevc", "av1"})
+
+# Segment files are named ``<prefix>_segment_<NNN>.mp4`` by the segment muxer.
+_SEGMENT_INDEX = re.compile(r"_segment_(\d+)\.mp4$")
+
+
+def _probe_with_ffprobe(video_path: str) -> dict:
+    """Spawn the ffprobe binary and parse its JSON output."""
     cmd = [
         "ffprobe",
         "-v", "quiet",
         "-print_format", "json",
-        "-show_format",
-        "-show_streams",
+        "-show_entries", _FFPROBE_ENTRIES,
         video_path
     ]
-    result = subprocess.run(cmd, capture_output=True, text=True)
+    result = subprocess.run(
+        cmd,
+        stdout=subprocess.PIPE,
+        stderr=subprocess.PIPE,
+        bufsize=65536,
+    )
     if result.returncode != 0:
-        raise RuntimeError(f"ffprobe failed: {result.stderr}")
-    return json.loads(result.stdout)
+        raise RuntimeError(f"ffprobe failed: {result.stderr.decode(errors='replace')}")
+    return orjson.loads(result.stdout)
+
+
+# ADTS sampling_frequency_index -> sample rate (ISO/IEC 14496-3)
+_ADTS_SAMPLE_RATES = (
+    96000, 88200, 64000, 48000, 44100, 32000,
+    24000, 22050, 16000, 12000, 11025, 8000, 7350,
+)
+
+
+def _adts_duration(audio_path: str) -> float | None:
+    """
+    Compute the duration of a raw AAC (ADTS) file by walking its frame headers.
+    
+    Every ADTS frame carries its own length and 1024 samples per raw data
+    block, so the duration follows from a header scan without spawning
+    ffprobe. Returns None if the file does not look like ADTS.
+    """
+    with open(audio_path, "rb") as f:
+        try:
+            data = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            return None
+    
+    with data:
+        size = len(data)
+        pos = 0
+        samples = 0
+        sample_rate = None
+        while pos + 7 <= size:
+            if data[pos] != 0xFF or (data[pos + 1] & 0xF6) != 0xF0:
+                return None
+            rate_index = (data[pos + 2] >> 2) & 0x0F
+            if rate_index >= len(_ADTS_SAMPLE_RATES):
+                return None
+            sample_rate = _ADTS_SAMPLE_RATES[rate_index]
+            frame_length = (
+                ((data[pos + 3] & 0x03) << 11)
+                | (data[pos + 4] << 3)
+                | (data[pos + 5] >> 5)
+            )
+            if frame_length < 7:
+                return None
+            samples += ((data[pos + 6] & 0x03) + 1) * 1024
+            pos += frame_length
+    
+    if sample_rate is None:
+        return None
+    return samples / sample_rate
+
+
+def read_segment_list(segment_list_path: str, output_dir: str) -> list[dict[str, Any]]:
+    """
+    Read the CSV segment list written by ffmpeg's segment muxer.
+    
+    Each row is ``filename,start,end`` with the filename relative to the
+    output directory, so segment durations come straight from ffmpeg instead
+    of a follow-up ffprobe per segment. The segment records are built in the
+    same pass, with a single stat per segment for both existence and size.
+    The index is taken from the filename, so a segment missing on disk
+    doesn't shift the ones after it.
+    
+    Returns:
+        Segment dicts with index, path, start_time, end_time, duration and
+        file_size, in segment order.
+    """
+    segments = []
+    try:
+        f = open(segment_list_path, newline="")
+    except FileNotFoundError:
+        return segments
+    
+    with f:
+        for row in csv.reader(f):
+            if len(row) < 3:
+                continue
+            seg_path = os.path.join(output_dir, row[0])
+            try:
+                seg_size = os.stat(seg_path).st_size
+            except FileNotFoundError:
+                continue
+            match = _SEGMENT_INDEX.search(row[0])
+            seg_start = float(row[1])
+            seg_end = float(row[2])
+            segments.append({
+                "index": int(match.group(1)) if match else len(segments),
+                "path": seg_path,
+                "start_time": seg_start,
+                "end_time": seg_end,
+                "duration": round(seg_end - seg_start, 2),
+                "file_size": seg_size,
+            })
+    return segments
+
+
+def ffmpeg_tool(action: str, require_path_arg: str = "video_path"):
+    """
+    Decorator holding the boilerplate shared by the video tools.
+    
+    Checks that the input file exists, times the call, adds
+    ``processing_time_ms`` to successful results and turns any exception
+    into the tools' ``{"error": ..., "success": False}`` envelope.
+    
+    Args:
+        action: Short description used in error messages ("analyze video").
+        require_path_arg: Name of the argument holding the input file path.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            path = bound.arguments[require_path_arg]
+            t0 = time.perf_counter_ns()
+            
+            try:
+                if not os.path.exists(path):
+                    error_msg = f"Video file not found: {path}"
+                    logger.error(error_msg)
+                    return {"error": error_msg, "success": False}
+                
+                result = func(*bound.args, **bound.kwargs)
+                
+            except Exception as e:
+                error_msg = f"Failed to {action}: {str(e)}"
+                logger.error(error_msg, video_path=path, error=str(e))
+                return {"error": error_msg, "success": False}
+            
+            if result.get("success"):
+                elapsed_ms = (time.perf_counter_ns() - t0) // 1_000_000
+                result.setdefault("processing_time_ms", elapsed_ms)
+                logger.info(
+                    "Tool completed",
+                    tool=func.__name__,
+                    video_path=path,
+                    processing_time_ms=elapsed_ms
+                )
+            return result
+        
+        return wrapper
+    
+    return decorator
 
 
 @tool
+@ffmpeg_tool("analyze video")
 def analyze_video(video_path: str) -> dict[str, Any]:
     """
     Analyze a video file and extract its metadata including duration, resolution, 
@@ -55,105 +297,106 @@ def analyze_video(video_path: str) -> dict[str, Any]:
         - format_name: Container format name
     """
     logger.info("Analyzing video", video_path=video_path)
-    start_time = datetime.utcnow()
     
-    try:
-        if not os.path.exists(video_path):
-            error_msg = f"Video file not found: {video_path}"
-            logger.error(error_msg)
-            return {"error": error_msg, "success": False}
-        
-        probe_data = _run_ffprobe(video_path)
-        
-        video_stream = None
-        audio_stream = None
-        for stream in probe_data.get("streams", []):
-            if stream.get("codec_type") == "video" and video_stream is None:
-                video_stream = stream
-            elif stream.get("codec_type") == "audio" and audio_stream is None:
-                audio_stream = stream
-        
-        format_info = probe_data.get("format", {})
-        
-        duration = float(format_info.get("duration", 0))
-        file_size = int(format_info.get("size", 0))
-        bitrate = int(format_info.get("bit_rate", 0)) if format_info.get("bit_rate") else None
-        format_name = format_info.get("format_name", "unknown")
-        
-        width = None
-        height = None
-        fps = None
-        codec = None
-        
-        if video_stream:
-            width = video_stream.get("width")
-            height = video_stream.get("height")
-            codec = video_stream.get("codec_name")
-            
-            fps_str = video_stream.get("r_frame_rate", "0/1")
-            if "/" in fps_str:
-                num, den = fps_str.split("/")
-                fps = float(num) / float(den) if float(den) > 0 else 0
-            else:
-                fps = float(fps_str)
-        
-        has_audio = audio_stream is not None
-        
-        elapsed_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
-        
-        result = {
-            "success": True,
-            "video_path": video_path,
-            "duration": round(duration, 2),
-            "width": width,
-            "height": height,
-            "fps": round(fps, 2) if fps else None,
-            "codec": codec,
-            "bitrate": bitrate,
-            "file_size": file_size,
-            "format_name": format_name,
-            "has_audio": has_audio,
-            "processing_time_ms": elapsed_ms,
-        }
-        
-        logger.info(
-            "Video analysis complete",
-            video_path=video_path,
-            duration=duration,
-            resolution=f"{width}x{height}",
-            fps=fps,
-            processing_time_ms=elapsed_ms
-        )
-        
-        return result
-        
-    except Exception as e:
-        error_msg = f"Failed to analyze video: {str(e)}"
-        logger.error(error_msg, video_path=video_path, error=str(e))
-        return {"error": error_msg, "success": False}
+    probe_data = _run_ffprobe(video_path)
+    
+    video_stream = None
+    audio_stream = None
+    for stream in probe_data.get("streams", []):
+        if stream.get("codec_type") == "video" and video_stream is None:
+            video_stream = stream
+        elif stream.get("codec_type") == "audio" and audio_stream is None:
+            audio_stream = stream
+    
+    format_info = probe_data.get("format", {})
+    
+    duration = float(format_info.get("duration", 0))
+    file_size = int(format_info.get("size", 0))
+    bitrate = int(format_info.get("bit_rate", 0)) if format_info.get("bit_rate") else None
+    format_name = format_info.get("format_name", "unknown")
+    
+    width = None
+    height = None
+    fps = None
+    codec = None
+    
+    if video_stream:
+        width = video_stream.get("width")
+        height = video_stream.get("height")
+        codec = video_stream.get("codec_name")
+        
+        fps_str = video_stream.get("r_frame_rate", "0/1")
+        if "/" in fps_str:
+            num, den = fps_str.split("/")
+            fps = float(num) / float(den) if float(den) > 0 else 0
+        else:
+            fps = float(fps_str)
+    
+    has_audio = audio_stream is not None
+    
+    logger.info(
+        "Video analysis complete",
+        video_path=video_path,
+        duration=duration,
+        resolution=f"{width}x{height}",
+        fps=fps
+    )
+    
+    return {
+        "success": True,
+        "video_path": video_path,
+        "duration": round(duration, 2),
+        "width": width,
+        "height": height,
+        "fps": round(fps, 2) if fps else None,
+        "codec": codec,
+        "bitrate": bitrate,
+        "file_size": file_size,
+        "format_name": format_name,
+        "has_audio": has_audio,
+    }
 
 
 @tool
+@ffmpeg_tool("segment video")
 def segment_video(
     video_path: str,
     output_dir: str,
     segment_duration: int = 15,
-    video_id: str = ""
+    video_id: str = "",
+    emit_thumbnails: bool = False,
+    thumbnails_dir: str = "",
+    thumbnail_width: int = 320,
+    thumbnail_height: int = 180,
+    thumbnail_offset: float = 0.0
 ) -> dict[str, Any]:
     """
     Split a video into segments of specified duration using FFmpeg.
     
+    H.264/HEVC/AV1 sources are stream-copied; other codecs are re-encoded
+    to H.264 so the segments stay playable.
+    
     Args:
         video_path: The absolute path to the video file to segment.
         output_dir: The directory where segments will be saved.
         segment_duration: Duration of each segment in seconds (default: 15).
         video_id: Unique identifier for the video (used in output filenames).
+        emit_thumbnails: Also write one thumbnail per segment in the same
+            FFmpeg pass (default: False).
+        thumbnails_dir: The directory where thumbnails will be saved
+            (defaults to output_dir).
+        thumbnail_width: The width of the thumbnails in pixels (default: 320).
+        thumbnail_height: The height of the thumbnails in pixels (default: 180).
+        thumbnail_offset: Seconds into each segment to take its thumbnail
+            from (default: 0, the segment's first frame).
     
     Returns:
         A dictionary containing:
         - success: Whether the operation succeeded
         - segments: List of created segment file paths
         - segment_count: Number of segments created
+        - segment_list_path: ffmpeg's CSV list of the segments (filename,start,end)
+        - thumbnail_path (per segment): Set when emit_thumbnails was requested
         - segment_duration: Duration used for segmentation
     """
     logger.info(
@@ -162,92 +405,112 @@ def segment_video(
         output_dir=output_dir,
         segment_duration=segment_duration
     )
-    start_time = datetime.utcnow()
     
-    try:
-        if not os.path.exists(video_path):
-            error_msg = f"Video file not found: {video_path}"
-            logger.error(error_msg)
-            return {"error": error_msg, "success": False}
-        
-        os.makedirs(output_dir, exist_ok=True)
-        
-        filename_prefix = video_id if video_id else Path(video_path).stem
-        output_pattern = os.path.join(output_dir, f"{filename_prefix}_segment_%03d.mp4")
-        
-        cmd = [
-            "ffmpeg",
-            "-i", video_path,
-            "-c", "copy",
-            "-f", "segment",
-            "-segment_time", str(segment_duration),
-            "-reset_timestamps", "1",
-            "-y",
-            output_pattern
+    _ensure_dir(output_dir)
+    
+    filename_prefix = video_id if video_id else Path(video_path).stem
+    output_pattern = os.path.join(output_dir, f"{filename_prefix}_segment_%03d.mp4")
+    segment_list_path = os.path.join(output_dir, f"{filename_prefix}_segments.csv")
+    
+    probe = _run_ffprobe(video_path)
+    video_codec = next(
+        (s.get("codec_name") for s in probe.get("streams", []) if s.get("codec_type") == "video"),
+        None
+    )
+    if video_codec in _STREAM_COPY_CODECS:
+        codec_args = ["-c", "copy"]
+    else:
+        # Re-encode, forcing a keyframe at every cut so segments stay even.
+        logger.info("Re-encoding for segmentation", video_path=video_path, codec=video_codec)
+        codec_args = [
+            "-c:v", "libx264",
+            "-preset", "veryfast",
+            "-force_key_frames", f"expr:gte(t,n_forced*{segment_duration})",
+            "-c:a", "aac",
         ]
-        
-        logger.debug("Running FFmpeg command", command=" ".join(cmd))
-        
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            logger.warning(
-                "FFmpeg returned non-zero exit code",
-                returncode=result.returncode,
-                stderr=result.stderr[:500] if result.stderr else None
-            )
-        
-        segments = sorted(
-            [
-                os.path.join(output_dir, f)
-                for f in os.listdir(output_dir)
-                if f.startswith(filename_prefix) and f.endswith(".mp4") and "_segment_" in f
-            ]
+    
+    cmd = [
+        "ffmpeg",
+        "-threads", str(settings.ffmpeg_threads_per_invocation),
+        "-i", video_path,
+        "-map", "0:v",
+        "-map", "0:a?",
+        *codec_args,
+        "-f", "segment",
+        "-segment_time", str(segment_duration),
+        "-segment_list", segment_list_path,
+        "-segment_list_type", "csv",
+        "-segment_format_options", "movflags=+faststart",
+        "-reset_timestamps", "1",
+        "-avoid_negative_ts", "make_zero",
+        "-y",
+        output_pattern
+    ]
+    
+    if emit_thumbnails:
+        thumbnails_dir = thumbnails_dir or output_dir
+        _ensure_dir(thumbnails_dir)
+        thumbnail_pattern = os.path.join(
+            thumbnails_dir, f"{filename_prefix}_segment_%03d_thumb.jpg"
         )
-        
-        segment_info = []
-        for idx, seg_path in enumerate(segments):
-            seg_probe = _run_ffprobe(seg_path)
-            seg_duration = float(seg_probe.get("format", {}).get("duration", 0))
-            seg_size = int(seg_probe.get("format", {}).get("size", 0))
-            
-            segment_info.append({
-                "index": idx,
-                "path": seg_path,
-                "start_time": idx * segment_duration,
-                "end_time": idx * segment_duration + seg_duration,
-                "duration": round(seg_duration, 2),
-                "file_size": seg_size,
-            })
-        
-        elapsed_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
-        
-        result = {
-            "success": True,
-            "video_path": video_path,
-            "output_dir": output_dir,
-            "segments": segment_info,
-            "segment_count": len(segments),
-            "segment_duration_setting": segment_duration,
-            "processing_time_ms": elapsed_ms,
-        }
-        
-        logger.info(
-            "Video segmentation complete",
-            video_path=video_path,
-            segment_count=len(segments),
-            processing_time_ms=elapsed_ms
+        # One frame every segment_duration seconds, starting thumbnail_offset
+        # in; each is checked against its segment's real bounds below.
+        # trim keeps the original timestamps, so fps counts from the offset.
+        thumbnail_filter = f"fps=1/{segment_duration},scale={thumbnail_width}:{thumbnail_height}"
+        if thumbnail_offset > 0:
+            thumbnail_filter = f"trim=start={thumbnail_offset}," + thumbnail_filter
+        cmd += [
+            "-map", "0:v:0",
+            "-vf", thumbnail_filter,
+            "-start_number", "0",
+        ]
+        duration = float(probe.get("format", {}).get("duration", 0))
+        if duration > thumbnail_offset:
+            cmd += ["-frames:v", str(math.ceil((duration - thumbnail_offset) / segment_duration))]
+        cmd += ["-y", thumbnail_pattern]
+    
+    logger.debug("Running FFmpeg command", command=" ".join(cmd))
+    
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    
+    if result.returncode != 0:
+        logger.warning(
+            "FFmpeg returned non-zero exit code",
+            returncode=result.returncode,
+            stderr=result.stderr[:500] if result.stderr else None
         )
-        
-        return result
-        
-    except Exception as e:
-        error_msg = f"Failed to segment video: {str(e)}"
-        logger.error(error_msg, video_path=video_path, error=str(e))
-        return {"error": error_msg, "success": False}
+    
+    segment_info = read_segment_list(segment_list_path, output_dir)
+    if emit_thumbnails:
+        for seg in segment_info:
+            thumb_path = thumbnail_pattern % seg["index"]
+            # Stream-copied cuts land on the next keyframe, not exactly on
+            # k * segment_duration; if the k-th frame was taken before this
+            # segment started (or after it ended), it belongs to a neighbour
+            # and the caller's per-segment fallback should take it instead.
+            taken_at = seg["index"] * segment_duration + thumbnail_offset
+            in_segment = seg["start_time"] - 1e-3 <= taken_at < seg["end_time"]
+            seg["thumbnail_path"] = thumb_path if in_segment and os.path.exists(thumb_path) else None
+    
+    logger.info(
+        "Video segmentation complete",
+        video_path=video_path,
+        segment_count=len(segment_info)
+    )
+    
+    return {
+        "success": True,
+        "video_path": video_path,
+        "output_dir": output_dir,
+        "segments": segment_info,
+        "segment_count": len(segment_info),
+        "segment_list_path": segment_list_path,
+        "segment_duration_setting": segment_duration,
+    }
 
 
 @tool
+@ffmpeg_tool("extract audio")
 def extract_audio(
     video_path: str,
     output_path: str
@@ -267,81 +530,66 @@ def extract_audio(
         - file_size: Size of the audio file in bytes
     """
     logger.info("Extracting audio", video_path=video_path, output_path=output_path)
-    start_time = datetime.utcnow()
     
-    try:
-        if not os.path.exists(video_path):
-            error_msg = f"Video file not found: {video_path}"
-            logger.error(error_msg)
-            return {"error": error_msg, "success": False}
-        
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        
-        cmd = [
-            "ffmpeg",
-            "-i", video_path,
-            "-vn",
-            "-acodec", "aac",
-            "-y",
-            output_path
-        ]
-        
-        logger.debug("Running FFmpeg command", command=" ".join(cmd))
-        
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            if "does not contain any stream" in result.stderr or "no audio" in result.stderr.lower():
-                logger.warning("Video has no audio track", video_path=video_path)
-                return {
-                    "success": True,
-                    "audio_path": None,
-                    "has_audio": False,
-                    "message": "Video has no audio track"
-                }
-            logger.warning(
-                "FFmpeg audio extraction warning",
-                returncode=result.returncode,
-                stderr=result.stderr[:500] if result.stderr else None
-            )
-        
-        if os.path.exists(output_path):
-            audio_probe = _run_ffprobe(output_path)
-            duration = float(audio_probe.get("format", {}).get("duration", 0))
-            file_size = int(audio_probe.get("format", {}).get("size", 0))
-            
-            elapsed_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
-            
-            result = {
-                "success": True,
-                "audio_path": output_path,
-                "has_audio": True,
-                "duration": round(duration, 2),
-                "file_size": file_size,
-                "processing_time_ms": elapsed_ms,
-            }
-            
-            logger.info(
-                "Audio extraction complete",
-                video_path=video_path,
-                audio_path=output_path,
-                duration=duration,
-                processing_time_ms=elapsed_ms
-            )
-            
-            return result
-        else:
+    _ensure_dir(os.path.dirname(output_path))
+    
+    cmd = [
+        "ffmpeg",
+        "-threads", str(settings.ffmpeg_threads_per_invocation),
+        "-i", video_path,
+        "-vn",
+        "-acodec", "aac",
+        "-y",
+        output_path
+    ]
+    
+    logger.debug("Running FFmpeg command", command=" ".join(cmd))
+    
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    
+    if result.returncode != 0:
+        if "does not contain any stream" in result.stderr or "no audio" in result.stderr.lower():
+            logger.warning("Video has no audio track", video_path=video_path)
             return {
                 "success": True,
                 "audio_path": None,
                 "has_audio": False,
-                "message": "No audio track found in video"
+                "message": "Video has no audio track"
             }
-        
-    except Exception as e:
-        error_msg = f"Failed to extract audio: {str(e)}"
-        logger.error(error_msg, video_path=video_path, error=str(e))
-        return {"error": error_msg, "success": False}
+        logger.warning(
+            "FFmpeg audio extraction warning",
+            returncode=result.returncode,
+            stderr=result.stderr[:500] if result.stderr else None
+        )
+    
+    if not os.path.exists(output_path):
+        return {
+            "success": True,
+            "audio_path": None,
+            "has_audio": False,
+            "message": "No audio track found in video"
+        }
+    
+    file_size = os.path.getsize(output_path)
+    duration = _adts_duration(output_path) if output_path.endswith(".aac") else None
+    if duration is None:
+        audio_probe = _run_ffprobe(output_path)
+        duration = float(audio_probe.get("format", {}).get("duration", 0))
+    
+    logger.info(
+        "Audio extraction complete",
+        video_path=video_path,
+        audio_path=output_path,
+        duration=duration
+    )
+    
+    return {
+        "success": True,
+        "audio_path": output_path,
+        "has_audio": True,
+        "duration": round(duration, 2),
+        "file_size": file_size,
+    }
 
 
 @tool
@@ -369,71 +617,120 @@ def generate_thumbnail(
         - timestamp: The timestamp used for capture
         - dimensions: The dimensions of the thumbnail
     """
+    return _generate_thumbnail(video_path, output_path, timestamp, width, height)
+
+
+@ffmpeg_tool("generate thumbnail")
+def _generate_thumbnail(
+    video_path: str,
+    output_path: str,
+    timestamp: float,
+    width: int,
+    height: int,
+    threads: int | None = None,
+) -> dict[str, Any]:
+    """
+    Implementation behind the generate_thumbnail tool.
+    
+    Kept separate from the @tool wrapper so the parallel path can pass the
+    per-invocation ffmpeg thread count.
+    """
     logger.info(
         "Generating thumbnail",
         video_path=video_path,
         output_path=output_path,
         timestamp=timestamp
     )
-    start_time = datetime.utcnow()
     
-    try:
-        if not os.path.exists(video_path):
-            error_msg = f"Video file not found: {video_path}"
-            logger.error(error_msg)
-            return {"error": error_msg, "success": False}
-        
-        os.makedirs(os.path.dirname(output_path), exist_ok=True)
-        
-        cmd = [
-            "ffmpeg",
-            "-ss", str(timestamp),
-            "-i", video_path,
-            "-vframes", "1",
-            "-vf", f"scale={width}:{height}",
-            "-y",
-            output_path
-        ]
-        
-        logger.debug("Running FFmpeg command", command=" ".join(cmd))
-        
-        result = subprocess.run(cmd, capture_output=True, text=True)
-        
-        if result.returncode != 0:
-            logger.warning(
-                "FFmpeg thumbnail generation warning",
-                returncode=result.returncode,
-                stderr=result.stderr[:500] if result.stderr else None
-            )
-        
-        if os.path.exists(output_path):
-            file_size = os.path.getsize(output_path)
-            elapsed_ms = int((datetime.utcnow() - start_time).total_seconds() * 1000)
-            
-            result = {
-                "success": True,
-                "thumbnail_path": output_path,
-                "timestamp": timestamp,
-                "width": width,
-                "height": height,
-                "file_size": file_size,
-                "processing_time_ms": elapsed_ms,
-            }
-            
-            logger.info(
-                "Thumbnail generation complete",
-                video_path=video_path,
-                thumbnail_path=output_path,
-                processing_time_ms=elapsed_ms
-            )
-            
-            return result
-        else:
-            error_msg = "Thumbnail file was not created"
-            logger.error(error_msg, video_path=video_path)
-            return {"error": error_msg, "success": False}
-        
-    except Exception as e:
-        error_msg = f"Failed to generate thumbnail: {str(e)}"
-        logger.error(error_msg, video_path=video_path, error=str(e))
+    _ensure_dir(os.path.dirname(output_path))
+    
+    if threads is None:
+        threads = settings.ffmpeg_threads_per_invocation
+    
+    cmd = [
+        "ffmpeg",
+        "-threads", str(threads),
+        "-ss", str(timestamp),
+        "-i", video_path,
+        "-vframes", "1",
+        "-vf", f"scale={width}:{height}",
+        "-y",
+        output_path
+    ]
+    
+    logger.debug("Running FFmpeg command", command=" ".join(cmd))
+    
+    result = subprocess.run(cmd, capture_output=True, text=True)
+    
+    if result.returncode != 0:
+        logger.warning(
+            "FFmpeg thumbnail generation warning",
+            returncode=result.returncode,
+            stderr=result.stderr[:500] if result.stderr else None
+        )
+    
+    if not os.path.exists(output_path):
+        error_msg = "Thumbnail file was not created"
+        logger.error(error_msg, video_path=video_path)
         return {"error": error_msg, "success": False}
+    
+    logger.info(
+        "Thumbnail generation complete",
+        video_path=video_path,
+        thumbnail_path=output_path
+    )
+    
+    return {
+        "success": True,
+        "thumbnail_path": output_path,
+        "timestamp": timestamp,
+        "width": width,
+        "height": height,
+        "file_size": os.path.getsize(output_path),
+    }
+
+
+def _generate_thumbnail_job(job: tuple) -> dict[str, Any]:
+    """Unpack a thumbnail job tuple inside a pool thread."""
+    return _generate_thumbnail(*job)
+
+
+def generate_thumbnails_parallel(
+    jobs: list[tuple[str, str, float, int, int]],
+    max_workers: int | None = None,
+) -> list[dict[str, Any]]:
+    """
+    Generate many thumbnails at once in a bounded thread pool.
+    
+    Each job is an ffmpeg subprocess, so threads only wait on it. Threads
+    also keep the fan-out inside the server process: forking it while other
+    threads hold locks could deadlock the children, and their log records
+    would never reach the log listener.
+    
+    Args:
+        jobs: (video_path, output_path, timestamp, width, height) tuples.
+        max_workers: Pool size (defaults to min(cpu_count, 4)).
+    
+    Returns:
+        One generate_thumbnail result dict per job, in job order.
+    """
+    if not jobs:
+        return []
+    
+    cpu_count = os.cpu_count() or 1
+    max_workers = max_workers or min(cpu_count, 4)
+    max_workers = min(max_workers, len(jobs))
+    threads = max(1, cpu_count // max_workers)
+    
+    logger.info(
+        "Generating thumbnails in parallel",
+        thumbnail_count=len(jobs),
+        max_workers=max_workers,
+        ffmpeg_threads=threads
+    )
+    
+    with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="thumbnail") as executor:
+        return list(executor.map(
+            _generate_thumbnail_job,
+            [(*job, threads) for job in jobs]
+        ))
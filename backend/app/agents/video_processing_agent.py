@@ -4,13 +4,20 @@ Video Processing Agent using AWS Strands.
 This agent handles the complete video processing pipeline:
 1. Analyze video metadata (duration, resolution, fps, codec)
 2. Split video into 15-second segments
-3. Extract audio tracks
-4. Generate thumbnails for each segment
+3. Extract audio tracks (concurrently with segmentation)
+4. Generate thumbnails for each segment (fanned out in a thread pool)
+
+The pipeline itself is driven deterministically and Bedrock is called once
+to summarize the collected results. The original Strands agent orchestration
+is still available with ``use_agent=True``.
 """
 
 import os
+import json
+import time
 import uuid
 from datetime import datetime
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional, Any
 from pathlib import Path
 
@@ -23,11 +30,20 @@ from app.agents.tools.video_tools import (
     segment_video,
     extract_audio,
     generate_thumbnail,
+    generate_thumbnails_parallel,
+    read_segment_list,
 )
 
 logger = get_logger("video_processing_agent")
 settings = get_settings()
 
+AGENT_TOOLS = (
+    analyze_video,
+    segment_video,
+    extract_audio,
+    generate_thumbnail,
+)
+
 
 VIDEO_PROCESSING_SYSTEM_PROMPT = """You are a Video Processing Agent for ChronoTrace, a forensic video intelligence platform.
 
@@ -39,7 +55,7 @@ Your role is to process surveillance videos through a systematic pipeline:
 
 3. **Extract Audio**: Extract the audio track from the original video for audio-based analysis.
 
-4. **Generate Thumbnails**: Create thumbnail images for each segment at the 3-second mark.
+4. **Generate Thumbnails**: Thumbnails for each segment are generated by the pipeline after segmentation and reported back to you; do not generate them yourself.
 
 IMPORTANT GUIDELINES:
 - Always start by analyzing the video to understand its properties
@@ -58,6 +74,22 @@ When processing is complete, provide a structured summary including:
 """
 
 
+VIDEO_SUMMARY_SYSTEM_PROMPT = """You are a Video Processing Agent for ChronoTrace, a forensic video intelligence platform.
+
+Surveillance videos are processed through a fixed pipeline: metadata analysis,
+15-second segmentation, audio extraction and per-segment thumbnail generation.
+The pipeline has already run; you are given the JSON results of every step.
+
+Provide a structured summary including:
+- Video metadata (duration, resolution, fps)
+- Number of segments created
+- Audio extraction status
+- Thumbnail generation status
+- Any errors or warnings encountered
+- Total processing time
+"""
+
+
 class VideoProcessingAgent:
     """
     Video Processing Agent that handles the complete video processing pipeline.
@@ -92,14 +124,12 @@ class VideoProcessingAgent:
             region_name=self.region_name,
             temperature=0.1,
             max_tokens=4096,
+            cache_prompt="default",
         )
         
-        self.tools = [
-            analyze_video,
-            segment_video,
-            extract_audio,
-            generate_thumbnail,
-        ]
+        self._created_dirs: set[str] = set()
+        
+        self.tools = list(AGENT_TOOLS)
         
         self.agent = Agent(
             model=self.bedrock_model,
@@ -115,6 +145,7 @@ class VideoProcessingAgent:
         video_id: Optional[str] = None,
         camera_id: Optional[str] = None,
         location: Optional[str] = None,
+        use_agent: bool = False,
     ) -> dict[str, Any]:
         """
         Process a video through the complete pipeline.
@@ -124,12 +155,14 @@ class VideoProcessingAgent:
             video_id: Unique identifier for the video (generated if not provided)
             camera_id: Optional camera identifier
             location: Optional location description
+            use_agent: Let the Strands agent orchestrate the tools instead of
+                running them directly and only summarizing with the model
         
         Returns:
             Dictionary containing processing results and metadata
         """
         video_id = video_id or str(uuid.uuid4())
-        start_time = datetime.utcnow()
+        t0 = time.perf_counter_ns()
         
         logger.info(
             "Starting video processing",
@@ -143,41 +176,36 @@ class VideoProcessingAgent:
         thumbnails_dir = str(settings.thumbnails_dir / video_id)
         audio_dir = str(settings.audio_dir)
         
-        os.makedirs(output_dir, exist_ok=True)
-        os.makedirs(thumbnails_dir, exist_ok=True)
-        os.makedirs(audio_dir, exist_ok=True)
+        for directory in (output_dir, thumbnails_dir, audio_dir):
+            if directory not in self._created_dirs:
+                os.makedirs(directory, exist_ok=True)
+                self._created_dirs.add(directory)
+        
+        audio_path = os.path.join(audio_dir, f"{video_id}_audio.aac")
         
-        prompt = f"""Process the video file at: {video_path}
-
-Video ID: {video_id}
-Camera ID: {camera_id or 'Not specified'}
-Location: {location or 'Not specified'}
-
-Please perform the following steps:
-
-1. First, analyze the video using the analyze_video tool to get its metadata.
-
-2. Then segment the video into 15-second segments using the segment_video tool:
-   - Output directory: {output_dir}
-   - Segment duration: {settings.segment_duration} seconds
-   - Video ID: {video_id}
-
-3. Extract the audio track using the extract_audio tool:
-   - Output path: {os.path.join(audio_dir, f"{video_id}_audio.aac")}
-
-4. For each segment created, generate a thumbnail using the generate_thumbnail tool:
-   - Output directory for thumbnails: {thumbnails_dir}
-   - Timestamp: {settings.thumbnail_timestamp} seconds into each segment
-   - Dimensions: {settings.thumbnail_width}x{settings.thumbnail_height}
-
-After completing all steps, provide a comprehensive summary of the processing results."""
-
         try:
-            logger.info("Invoking Video Processing Agent", video_id=video_id)
-            
-            result = self.agent(prompt)
+            if use_agent:
+                pipeline_result = self._run_agent_pipeline(
+                    video_path=video_path,
+                    video_id=video_id,
+                    camera_id=camera_id,
+                    location=location,
+                    output_dir=output_dir,
+                    thumbnails_dir=thumbnails_dir,
+                    audio_path=audio_path,
+                )
+            else:
+                pipeline_result = self._run_pipeline(
+                    video_path=video_path,
+                    video_id=video_id,
+                    camera_id=camera_id,
+                    location=location,
+                    output_dir=output_dir,
+                    thumbnails_dir=thumbnails_dir,
+                    audio_path=audio_path,
+                )
             
-            elapsed_time = (datetime.utcnow() - start_time).total_seconds()
+            elapsed_time = (time.perf_counter_ns() - t0) / 1_000_000_000
             
             processing_result = {
                 "success": True,
@@ -188,19 +216,11 @@ After completing all steps, provide a comprehensive summary of the processing re
                 "output_dir": output_dir,
                 "thumbnails_dir": thumbnails_dir,
                 "audio_dir": audio_dir,
-                "agent_response": str(result),
+                **pipeline_result,
                 "processing_time_seconds": round(elapsed_time, 2),
                 "timestamp": datetime.utcnow().isoformat(),
             }
             
-            if hasattr(result, 'metrics'):
-                metrics = result.metrics
-                processing_result["metrics"] = {
-                    "total_tokens": metrics.accumulated_usage.get("totalTokens", 0) if hasattr(metrics, 'accumulated_usage') else 0,
-                    "input_tokens": metrics.accumulated_usage.get("inputTokens", 0) if hasattr(metrics, 'accumulated_usage') else 0,
-                    "output_tokens": metrics.accumulated_usage.get("outputTokens", 0) if hasattr(metrics, 'accumulated_usage') else 0,
-                }
-            
             logger.info(
                 "Video processing completed successfully",
                 video_id=video_id,
@@ -210,7 +230,7 @@ After completing all steps, provide a comprehensive summary of the processing re
             return processing_result
             
         except Exception as e:
-            elapsed_time = (datetime.utcnow() - start_time).total_seconds()
+            elapsed_time = (time.perf_counter_ns() - t0) / 1_000_000_000
             error_msg = str(e)
             
             logger.error(
@@ -229,6 +249,250 @@ After completing all steps, provide a comprehensive summary of the processing re
                 "timestamp": datetime.utcnow().isoformat(),
             }
     
+    def _run_pipeline(
+        self,
+        video_path: str,
+        video_id: str,
+        camera_id: Optional[str],
+        location: Optional[str],
+        output_dir: str,
+        thumbnails_dir: str,
+        audio_path: str,
+    ) -> dict[str, Any]:
+        """
+        Run the pipeline steps directly and ask the model only for a summary.
+        
+        Returns:
+            Pipeline results to merge into the processing result
+        """
+        logger.info("Running video processing pipeline", video_id=video_id)
+        
+        analysis = analyze_video(video_path=video_path)
+        if not analysis.get("success"):
+            raise RuntimeError(analysis.get("error", "Video analysis failed"))
+        
+        # Segmentation and audio extraction both only read the source
+        # file, so their ffmpeg processes run side by side.
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            segment_future = executor.submit(
+                segment_video,
+                video_path=video_path,
+                output_dir=output_dir,
+                segment_duration=settings.segment_duration,
+                video_id=video_id,
+                emit_thumbnails=True,
+                thumbnails_dir=thumbnails_dir,
+                thumbnail_width=settings.thumbnail_width,
+                thumbnail_height=settings.thumbnail_height,
+                thumbnail_offset=min(settings.thumbnail_timestamp, settings.segment_duration / 2),
+            )
+            audio_future = executor.submit(
+                extract_audio,
+                video_path=video_path,
+                output_path=audio_path,
+            )
+            segmentation = segment_future.result()
+            audio = audio_future.result()
+        
+        if not segmentation.get("success"):
+            raise RuntimeError(segmentation.get("error", "Video segmentation failed"))
+        
+        # Thumbnails come out of the segmentation pass; only segments it
+        # missed (e.g. a final segment shorter than the offset, or one whose
+        # keyframe-aligned cut moved it off the sampled frame) are retried.
+        segments = segmentation.get("segments", [])
+        thumbnail_results = self._generate_segment_thumbnails(
+            video_id=video_id,
+            segments=segments,
+            thumbnails_dir=thumbnails_dir,
+        )
+        thumbnails_created = sum(1 for seg in segments if seg.get("thumbnail_path"))
+        
+        context = {
+            "video_id": video_id,
+            "video_path": video_path,
+            "camera_id": camera_id,
+            "location": location,
+            "analysis": analysis,
+            "segmentation": {k: v for k, v in segmentation.items() if k != "segments"},
+            "audio": audio,
+            "thumbnails": {
+                "created": thumbnails_created,
+                "requested": len(segments),
+                "errors": [r.get("error") for r in thumbnail_results if not r.get("success")],
+            },
+        }
+        
+        logger.info("Requesting processing summary", video_id=video_id)
+        # The summary is optional; a Bedrock failure (throttling,
+        # credentials, network) must not throw away the finished ffmpeg work.
+        try:
+            summary, usage = self._summarize(json.dumps(context, indent=2, default=str))
+            metrics = self._usage_metrics(usage)
+        except Exception as e:
+            logger.warning("Processing summary failed", video_id=video_id, error=str(e))
+            summary, metrics = None, {}
+        
+        return {
+            "metadata": analysis,
+            "segments": segments,
+            "segment_count": len(segments),
+            "audio": audio,
+            "thumbnail_count": thumbnails_created,
+            "agent_response": summary,
+            "metrics": metrics,
+        }
+    
+    def _run_agent_pipeline(
+        self,
+        video_path: str,
+        video_id: str,
+        camera_id: Optional[str],
+        location: Optional[str],
+        output_dir: str,
+        thumbnails_dir: str,
+        audio_path: str,
+    ) -> dict[str, Any]:
+        """
+        Let the Strands agent orchestrate the pipeline tools itself.
+        
+        Returns:
+            Pipeline results to merge into the processing result
+        """
+        prompt = f"""Process the video file at: {video_path}
+
+Video ID: {video_id}
+Camera ID: {camera_id or 'Not specified'}
+Location: {location or 'Not specified'}
+
+Please perform the following steps:
+
+1. First, analyze the video using the analyze_video tool to get its metadata.
+
+2. Then segment the video into 15-second segments using the segment_video tool:
+   - Output directory: {output_dir}
+   - Segment duration: {settings.segment_duration} seconds
+   - Video ID: {video_id}
+
+3. Extract the audio track using the extract_audio tool:
+   - Output path: {audio_path}
+
+Do not generate thumbnails; they are created for every segment once you are done and the results will be sent to you for the final summary."""
+
+        logger.info("Invoking Video Processing Agent", video_id=video_id)
+        
+        # The agent is reused across videos; start each one from a clean
+        # conversation so earlier runs don't leak into the prompt.
+        self.agent.messages = []
+        self.agent(prompt)
+        
+        segments = read_segment_list(
+            os.path.join(output_dir, f"{video_id}_segments.csv"), output_dir
+        )
+        thumbnail_results = self._generate_segment_thumbnails(
+            video_id=video_id,
+            segments=segments,
+            thumbnails_dir=thumbnails_dir,
+        )
+        thumbnails_created = sum(1 for r in thumbnail_results if r.get("success"))
+        
+        summary_prompt = f"""Thumbnail generation finished for video {video_id}.
+
+Thumbnails created: {thumbnails_created} of {len(thumbnail_results)} segments
+Thumbnail results: {thumbnail_results}
+
+Now provide a comprehensive summary of the processing results."""
+        
+        result = self.agent(summary_prompt)
+        
+        pipeline_result = {
+            "segments": segments,
+            "segment_count": len(segments),
+            "thumbnail_count": thumbnails_created,
+            "agent_response": str(result),
+        }
+        
+        if hasattr(result, 'metrics') and hasattr(result.metrics, 'accumulated_usage'):
+            pipeline_result["metrics"] = self._usage_metrics(result.metrics.accumulated_usage)
+        
+        return pipeline_result
+    
+    def _summarize(self, context_json: str) -> tuple[str, dict]:
+        """
+        Ask the Bedrock model for a summary of the pipeline results.
+        
+        Args:
+            context_json: JSON-encoded results of every pipeline step
+        
+        Returns:
+            Tuple of (summary text, Converse API usage dict)
+        """
+        response = self.bedrock_model.client.converse(
+            modelId=self.model_id,
+            system=[
+                {"text": VIDEO_SUMMARY_SYSTEM_PROMPT},
+                {"cachePoint": {"type": "default"}},
+            ],
+            messages=[{
+                "role": "user",
+                "content": [{"text": f"Summarize these processing results:\n\n{context_json}"}],
+            }],
+            inferenceConfig={"temperature": 0.1, "maxTokens": 4096},
+        )
+        
+        content = response.get("output", {}).get("message", {}).get("content", [])
+        summary = "".join(block.get("text", "") for block in content)
+        return summary, response.get("usage", {})
+    
+    @staticmethod
+    def _usage_metrics(usage: dict) -> dict[str, int]:
+        """Map Bedrock token usage onto the processing result's metrics keys."""
+        return {
+            "total_tokens": usage.get("totalTokens", 0),
+            "input_tokens": usage.get("inputTokens", 0),
+            "output_tokens": usage.get("outputTokens", 0),
+            "cache_read_input_tokens": usage.get("cacheReadInputTokens", 0),
+        }
+    
+    def _generate_segment_thumbnails(
+        self,
+        video_id: str,
+        segments: list[dict[str, Any]],
+        thumbnails_dir: str,
+    ) -> list[dict[str, Any]]:
+        """
+        Generate thumbnails for segments that don't have one yet.
+        
+        Sets ``thumbnail_path`` on each such segment dict (None if it failed).
+        
+        Args:
+            video_id: Video ID the segments belong to
+            segments: Segment dicts from read_segment_list
+            thumbnails_dir: Directory where thumbnails are written
+        
+        Returns:
+            List of generate_thumbnail result dictionaries
+        """
+        pending = [seg for seg in segments if not seg.get("thumbnail_path")]
+        thumbnail_timestamp = settings.thumbnail_timestamp
+        width = settings.thumbnail_width
+        height = settings.thumbnail_height
+        jobs = []
+        for seg in pending:
+            thumb_path = os.path.join(thumbnails_dir, f"{Path(seg['path']).stem}_thumb.jpg")
+            timestamp = min(thumbnail_timestamp, seg["duration"] / 2)
+            jobs.append((seg["path"], thumb_path, timestamp, width, height))
+        
+        logger.info(
+            "Generating segment thumbnails",
+            video_id=video_id,
+            segment_count=len(jobs)
+        )
+        results = generate_thumbnails_parallel(jobs)
+        for seg, result in zip(pending, results):
+            seg["thumbnail_path"] = result.get("thumbnail_path") if result.get("success") else None
+        return results
+    
     def analyze_only(self, video_path: str) -> dict[str, Any]:
         """
         Only analyze a video without full processing.
@@ -244,14 +508,27 @@ After completing all steps, provide a comprehensive summary of the processing re
     
     def get_agent_info(self) -> dict[str, Any]:
         """Get information about the agent configuration."""
-        return {
-            "name": "VideoProcessingAgent",
-            "model_id": self.model_id,
-            "region": self.region_name,
-            "tools": [tool.__name__ for tool in self.tools],
-            "segment_duration": settings.segment_duration,
-            "thumbnail_dimensions": f"{settings.thumbnail_width}x{settings.thumbnail_height}",
-        }
+        return agent_info(self.model_id, self.region_name)
+
+
+def agent_info(
+    model_id: Optional[str] = None,
+    region_name: Optional[str] = None,
+) -> dict[str, Any]:
+    """
+    Describe an agent's configuration without building one.
+    
+    Everything reported comes from settings and the tool list, so there is
+    no need to set up a Bedrock client just to answer this.
+    """
+    return {
+        "name": "VideoProcessingAgent",
+        "model_id": model_id or settings.bedrock_model_id,
+        "region": region_name or settings.aws_region,
+        "tools": [tool.__name__ for tool in AGENT_TOOLS],
+        "segment_duration": settings.segment_duration,
+        "thumbnail_dimensions": f"{settings.thumbnail_width}x{settings.thumbnail_height}",
+    }
 
 
 def create_video_processing_agent(
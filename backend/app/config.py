@@ -3,15 +3,24 @@ Configuration module for ChronoTrace backend.
 Handles all application settings, AWS configuration, and logging setup.
 """
 
+import io
 import os
+import sys
+import queue
 import logging
+import logging.handlers
+import orjson
 import structlog
 from pathlib import Path
-from functools import lru_cache
+from functools import cached_property, lru_cache
 from pydantic_settings import BaseSettings
 from pydantic import Field
 
 
+# Directories already created by ensure_directories() in this process.
+_ensured: set[Path] = set()
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables."""
     
@@ -23,6 +32,10 @@ class Settings(BaseSettings):
     # Server Settings
     host: str = Field(default="0.0.0.0", description="Server host")
     port: int = Field(default=8000, description="Server port")
+    cors_origins: list[str] = Field(
+        default=["http://localhost:3000", "http://localhost:5173"],
+        description="Origins allowed to make cross-origin requests"
+    )
     
     # AWS Settings
     aws_region: str = Field(default="us-east-1", description="AWS region")
@@ -44,6 +57,7 @@ class Settings(BaseSettings):
         default="sqlite+aiosqlite:///./data/chronotrace.db",
         description="Database connection URL"
     )
+    sql_echo: bool = Field(default=False, description="Log every SQL statement")
     
     # Storage Paths
     data_dir: Path = Field(default=Path("./data"), description="Data directory")
@@ -51,12 +65,44 @@ class Settings(BaseSettings):
     processed_dir: Path = Field(default=Path("./data/processed"), description="Processed videos directory")
     thumbnails_dir: Path = Field(default=Path("./data/thumbnails"), description="Thumbnails directory")
     audio_dir: Path = Field(default=Path("./data/audio"), description="Audio files directory")
+    upload_write_buffer: int = Field(
+        default=8 * 1024 * 1024,
+        ge=64 * 1024,
+        description="Bytes of an upload buffered in memory between disk writes"
+    )
+    upload_chunk_size: int = Field(
+        default=16 * 1024 * 1024,
+        ge=1024 * 1024,
+        description="Chunk size suggested to clients of the chunked upload endpoints; larger chunks are refused"
+    )
+    chunked_upload_ttl: int = Field(
+        default=24 * 60 * 60,
+        ge=60,
+        description="Seconds without a new chunk after which a chunked upload is deleted"
+    )
     
     # Video Processing Settings
     segment_duration: int = Field(default=15, description="Video segment duration in seconds")
     thumbnail_timestamp: int = Field(default=3, description="Timestamp for thumbnail extraction in seconds")
     thumbnail_width: int = Field(default=320, description="Thumbnail width")
     thumbnail_height: int = Field(default=180, description="Thumbnail height")
+    ffmpeg_threads_per_invocation: int = Field(
+        default=2,
+        ge=0,
+        le=64,
+        description="Threads each FFmpeg process may use (0 lets FFmpeg decide)"
+    )
+    video_worker_count: int = Field(
+        default=2,
+        ge=1,
+        le=32,
+        description="Videos that may run through the processing pipeline at once"
+    )
+    processing_queue_capacity: int = Field(
+        default=32,
+        ge=1,
+        description="Videos that may wait for a worker before /process returns 503"
+    )
     
     # Qdrant Settings
     qdrant_host: str = Field(default="localhost", description="Qdrant host")
@@ -67,12 +113,27 @@ class Settings(BaseSettings):
     # Logging Settings
     log_level: str = Field(default="INFO", description="Logging level")
     log_format: str = Field(default="json", description="Log format (json or console)")
+    request_log_sample_rate: int = Field(
+        default=1,
+        ge=1,
+        description="Log 1 in N successful requests (errors and slow requests are always logged)"
+    )
+    request_log_slow_ms: int = Field(
+        default=1000,
+        ge=0,
+        description="Requests at least this slow are always logged"
+    )
     
     class Config:
         env_file = ".env"
         env_file_encoding = "utf-8"
         extra = "ignore"
     
+    @cached_property
+    def log_level_int(self) -> int:
+        """Numeric logging level for log_level, falling back to INFO."""
+        return getattr(logging, self.log_level.upper(), logging.INFO)
+    
     def ensure_directories(self) -> None:
         """Create all required directories if they don't exist."""
         directories = [
@@ -83,7 +144,66 @@ class Settings(BaseSettings):
             self.audio_dir,
         ]
         for directory in directories:
+            if directory in _ensured:
+                continue
             directory.mkdir(parents=True, exist_ok=True)
+            _ensured.add(directory)
+
+
+# Log records are enqueued on the calling thread and written to stdout by a
+# QueueListener thread, so request handlers never block on the write.
+_log_queue: queue.Queue = queue.Queue(-1)
+_log_listener: logging.handlers.QueueListener | None = None
+_log_listener_running = False
+
+
+class _BufferedStreamHandler(logging.StreamHandler):
+    """StreamHandler that leaves flushing to its listener instead of every record."""
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        try:
+            self.stream.write(self.format(record) + self.terminator)
+        except Exception:
+            self.handleError(record)
+
+
+def _buffered_stdout() -> io.TextIOBase:
+    """Wrap stdout in a 4 KiB buffer so several log lines share one write()."""
+    if not hasattr(sys.stdout, "buffer"):
+        return sys.stdout
+    return io.TextIOWrapper(
+        io.BufferedWriter(sys.stdout.buffer, buffer_size=4096),
+        encoding=sys.stdout.encoding,
+        errors="backslashreplace",
+        write_through=False,
+    )
+
+
+_log_handler = _BufferedStreamHandler(_buffered_stdout())
+
+
+class _FlushingQueueListener(logging.handlers.QueueListener):
+    """
+    QueueListener that flushes its handlers each time the queue runs dry.
+    
+    A burst of records shares buffered writes, and the last of them is
+    written out as soon as the burst ends, all on the listener thread.
+    """
+    
+    def dequeue(self, block: bool) -> logging.LogRecord:
+        try:
+            return self.queue.get_nowait()
+        except queue.Empty:
+            if not block:
+                raise
+        for handler in self.handlers:
+            handler.flush()
+        return self.queue.get(block)
+
+
+def _orjson_dumps(obj, **kwargs) -> str:
+    """orjson serializer for JSONRenderer; stdlib handlers need str."""
+    return orjson.dumps(obj, **kwargs).decode()
 
 
 @lru_cache()
@@ -107,7 +227,7 @@ def setup_logging(settings: Settings | None = None) -> structlog.BoundLogger:
     if settings is None:
         settings = get_settings()
     
-    log_level = getattr(logging, settings.log_level.upper(), logging.INFO)
+    log_level = settings.log_level_int
     
     shared_processors = [
         structlog.contextvars.merge_contextvars,
@@ -118,7 +238,7 @@ def setup_logging(settings: Settings | None = None) -> structlog.BoundLogger:
     ]
     
     if settings.log_format == "json":
-        renderer = structlog.processors.JSONRenderer()
+        renderer = structlog.processors.JSONRenderer(serializer=_orjson_dumps)
     else:
         renderer = structlog.dev.ConsoleRenderer(colors=True)
     
@@ -129,15 +249,17 @@ def setup_logging(settings: Settings | None = None) -> structlog.BoundLogger:
         ],
         wrapper_class=structlog.make_filtering_bound_logger(log_level),
         context_class=dict,
-        logger_factory=structlog.PrintLoggerFactory(),
+        logger_factory=structlog.stdlib.LoggerFactory(),
         cache_logger_on_first_use=True,
     )
     
-    logging.basicConfig(
-        format="%(message)s",
-        level=log_level,
-        handlers=[logging.StreamHandler()],
-    )
+    global _log_listener
+    if _log_listener is None:
+        _log_listener = _FlushingQueueListener(_log_queue, _log_handler)
+    
+    root_logger = logging.getLogger()
+    root_logger.handlers = [logging.handlers.QueueHandler(_log_queue)]
+    root_logger.setLevel(log_level)
     
     for logger_name in ["boto3", "botocore", "urllib3"]:
         logging.getLogger(logger_name).setLevel(logging.WARNING)
@@ -145,10 +267,36 @@ def setup_logging(settings: Settings | None = None) -> structlog.BoundLogger:
     return structlog.get_logger()
 
 
+def start_log_listener() -> None:
+    """Start the background thread that writes queued log records."""
+    global _log_listener_running
+    if _log_listener is not None and not _log_listener_running:
+        _log_listener.start()
+        _log_listener_running = True
+
+
+def stop_log_listener() -> None:
+    """Flush queued log records and stop the writer thread."""
+    global _log_listener_running
+    if _log_listener is not None and _log_listener_running:
+        _log_listener.stop()
+        _log_listener_running = False
+    flush_logs()
+
+
+def flush_logs() -> None:
+    """Write out any buffered log lines."""
+    _log_handler.flush()
+
+
+@lru_cache(maxsize=64)
 def get_logger(name: str | None = None) -> structlog.BoundLogger:
     """
     Get a logger instance with optional name binding.
     
+    Bound loggers are immutable, so one instance per name is shared by
+    every caller.
+    
     Args:
         name: Optional logger name to bind.
     
@@ -4,34 +4,176 @@ ChronoTrace Backend - Main FastAPI Application
 Forensic Video Intelligence Platform powered by AWS Nova and Strands Agents.
 """
 
+import asyncio
+import itertools
+import orjson
 from contextlib import asynccontextmanager
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, Response
 import time
 
-from app.config import get_settings, setup_logging, get_logger
-from app.models.database import init_db
-from app.router.video import router as video_router
+try:
+    import fcntl
+except ImportError:  # Windows: the single-process rule goes unenforced
+    fcntl = None
+
+from app.config import (
+    get_settings,
+    setup_logging,
+    get_logger,
+    start_log_listener,
+    stop_log_listener,
+)
 
 settings = get_settings()
 setup_logging(settings)
 logger = get_logger("main")
 
 
+def _register_routers(app: FastAPI) -> None:
+    """
+    Import and mount the API routers.
+    
+    Done from lifespan rather than at import time so the router's
+    SQLAlchemy/agent dependency tree is not loaded until the app starts.
+    """
+    from app.router.video import router as video_router
+    
+    app.include_router(video_router, prefix="/api/v1")
+    logger.info("Routers registered")
+
+
+def _build_static_responses(app: FastAPI) -> None:
+    """
+    Serialize the bodies of the static info endpoints once.
+    
+    Everything they return comes from settings, which are fixed for the
+    life of the process, so there is no reason to re-encode them per request.
+    """
+    app.state.root_json = orjson.dumps({
+        "name": settings.app_name,
+        "version": settings.app_version,
+        "description": "Forensic Video Intelligence Platform",
+        "docs": app.docs_url,
+        "health": "/health",
+    })
+    app.state.health_json = orjson.dumps({
+        "status": "healthy",
+        "version": settings.app_version,
+        "service": "chronotrace-api",
+    })
+    app.state.config_json = orjson.dumps({
+        "app_name": settings.app_name,
+        "app_version": settings.app_version,
+        "aws_region": settings.aws_region,
+        "bedrock_model_id": settings.bedrock_model_id,
+        "segment_duration": settings.segment_duration,
+        "thumbnail_dimensions": f"{settings.thumbnail_width}x{settings.thumbnail_height}",
+        "qdrant_host": settings.qdrant_host,
+        "qdrant_port": settings.qdrant_port,
+    })
+
+
+class NDJSONAwareGZipMiddleware:
+    """
+    GZipMiddleware that leaves the streamed ``*.ndjson`` endpoints alone.
+    
+    zlib holds output back until its buffer fills, which would stop those
+    lines from reaching the client as they are produced.
+    """
+    
+    def __init__(self, app, minimum_size: int = 500):
+        self.app = app
+        self.gzip = GZipMiddleware(app, minimum_size=minimum_size)
+    
+    async def __call__(self, scope, receive, send):
+        if scope["type"] == "http" and scope["path"].endswith(".ndjson"):
+            await self.app(scope, receive, send)
+        else:
+            await self.gzip(scope, receive, send)
+
+
+def _acquire_instance_lock():
+    """
+    Take an exclusive lock on the data directory for this process.
+    
+    Processing jobs are held in this process's memory, and startup returns
+    videos left queued or processing to PENDING. A second API process on the
+    same data would reset videos the first is still working on, so it is
+    refused instead.
+    
+    Returns:
+        The open lock file; the lock lasts until it is closed
+    """
+    lock_file = open(settings.data_dir / ".api.lock", "a")
+    if fcntl is not None:
+        try:
+            fcntl.flock(lock_file, fcntl.LOCK_EX | fcntl.LOCK_NB)
+        except BlockingIOError:
+            lock_file.close()
+            raise RuntimeError(
+                f"Another ChronoTrace API process is using {settings.data_dir}; "
+                "run a single worker process"
+            )
+    return lock_file
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan manager for startup and shutdown events."""
+    start_log_listener()
     logger.info(
         "Starting ChronoTrace API",
         version=settings.app_version,
         debug=settings.debug
     )
     
-    await init_db()
+    _register_routers(app)
+    _build_static_responses(app)
+    
+    from sqlalchemy import text
+    from app.models.database import init_db, AsyncSessionLocal
+    
+    # Independent startup steps; ensure_directories() is a no-op for paths
+    # get_settings() already created.
+    await asyncio.gather(init_db(), asyncio.to_thread(settings.ensure_directories))
     logger.info("Database initialized")
     
-    settings.ensure_directories()
+    # Check a pooled connection out through a session once so the first
+    # request doesn't pay for it.
+    async with AsyncSessionLocal() as session:
+        await session.execute(text("SELECT 1"))
+    
+    from app.services.processing_queue import ProcessingQueue
+    from app.services.video_service import VideoService
+    
+    # Jobs queued or running when the last process stopped are gone with its
+    # in-memory queue; make those videos processable again. The lock makes
+    # sure no other live process owns them.
+    instance_lock = _acquire_instance_lock()
+    async with AsyncSessionLocal() as session:
+        reset = await VideoService(session).reset_interrupted()
+        await session.commit()
+    if reset:
+        logger.warning("Reset interrupted videos to pending", count=reset)
+    
+    from app.router.video import chunked_uploads
+    from app.services.chunked_upload import expire_periodically
+    
+    # Same for chunked uploads a previous run was assembling.
+    await asyncio.to_thread(chunked_uploads.recover)
+    upload_expirer = asyncio.create_task(
+        expire_periodically(chunked_uploads, settings.chunked_upload_ttl)
+    )
+    
+    app.state.processing_queue = ProcessingQueue(
+        capacity=settings.processing_queue_capacity,
+        concurrency=settings.video_worker_count,
+    )
+    app.state.processing_queue.start()
+    
     logger.info(
         "Storage directories ready",
         videos_dir=str(settings.videos_dir),
@@ -47,6 +189,10 @@ async def lifespan(app: FastAPI):
     yield
     
     logger.info("Shutting down ChronoTrace API")
+    upload_expirer.cancel()
+    await app.state.processing_queue.stop()
+    instance_lock.close()
+    stop_log_listener()
 
 
 app = FastAPI(
@@ -73,36 +219,48 @@ app = FastAPI(
     4. **Anomaly Detection Agent** ⚠️ - (Coming Soon) Flags suspicious activities
     """,
     version=settings.app_version,
-    docs_url="/docs",
-    redoc_url="/redoc",
+    docs_url="/docs" if settings.debug else None,
+    redoc_url="/redoc" if settings.debug else None,
+    openapi_url="/openapi.json" if settings.debug else None,
     lifespan=lifespan,
 )
 
 app.add_middleware(
     CORSMiddleware,
-    allow_origins=["http://localhost:3000", "http://localhost:5173", "*"],
+    allow_origins=settings.cors_origins,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=86400,
 )
+# Segment/log-heavy JSON is mostly repeated keys and compresses very well.
+app.add_middleware(NDJSONAwareGZipMiddleware, minimum_size=1024)
+
+
+_request_counter = itertools.count()
 
 
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
-    """Middleware to log all requests with timing information."""
-    start_time = time.time()
+    """Middleware to time requests and log a sample of them."""
+    start_ns = time.perf_counter_ns()
     
     response = await call_next(request)
     
-    duration_ms = int((time.time() - start_time) * 1000)
+    duration_ms = (time.perf_counter_ns() - start_ns) // 1_000_000
     
-    logger.info(
-        "Request completed",
-        method=request.method,
-        path=request.url.path,
-        status_code=response.status_code,
-        duration_ms=duration_ms,
-    )
+    if (
+        response.status_code >= 400
+        or duration_ms >= settings.request_log_slow_ms
+        or next(_request_counter) % settings.request_log_sample_rate == 0
+    ):
+        logger.info(
+            "Request completed",
+            method=request.method,
+            path=request.url.path,
+            status_code=response.status_code,
+            duration_ms=duration_ms,
+        )
     
     response.headers["X-Process-Time-Ms"] = str(duration_ms)
     return response
@@ -127,44 +285,22 @@ async def global_exception_handler(request: Request, exc: Exception):
     )
 
 
-app.include_router(video_router, prefix="/api/v1")
-
-
 @app.get("/", tags=["Health"])
-async def root():
+async def root(request: Request):
     """Root endpoint with API information."""
-    return {
-        "name": settings.app_name,
-        "version": settings.app_version,
-        "description": "Forensic Video Intelligence Platform",
-        "docs": "/docs",
-        "health": "/health",
-    }
+    return Response(request.app.state.root_json, media_type="application/json")
 
 
 @app.get("/health", tags=["Health"])
-async def health_check():
+async def health_check(request: Request):
     """Health check endpoint."""
-    return {
-        "status": "healthy",
-        "version": settings.app_version,
-        "service": "chronotrace-api",
-    }
+    return Response(request.app.state.health_json, media_type="application/json")
 
 
 @app.get("/api/v1/config", tags=["Config"])
-async def get_config():
+async def get_config(request: Request):
     """Get current configuration (non-sensitive values only)."""
-    return {
-        "app_name": settings.app_name,
-        "app_version": settings.app_version,
-        "aws_region": settings.aws_region,
-        "bedrock_model_id": settings.bedrock_model_id,
-        "segment_duration": settings.segment_duration,
-        "thumbnail_dimensions": f"{settings.thumbnail_width}x{settings.thumbnail_height}",
-        "qdrant_host": settings.qdrant_host,
-        "qdrant_port": settings.qdrant_port,
-    }
+    return Response(request.app.state.config_json, media_type="application/json")
 
 
 if __name__ == "__main__":
@@ -175,5 +311,5 @@ if __name__ == "__main__":
         host=settings.host,
         port=settings.port,
         reload=settings.debug,
-        log_level=settings.log_level.lower(),
+        log_level=settings.log_level_int,
     )
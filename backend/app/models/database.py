@@ -2,7 +2,9 @@
 Database connection and session management.
 """
 
+import logging
 from typing import AsyncGenerator
+from sqlalchemy import event, inspect, text
 from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sessionmaker
 from sqlalchemy.orm import DeclarativeBase
 
@@ -17,11 +19,37 @@ class Base(DeclarativeBase):
     pass
 
 
+# echo=True would attach SQLAlchemy's own stderr handler; raising the logger
+# level instead sends statements through the root QueueHandler like every
+# other record.
 engine = create_async_engine(
     settings.database_url,
-    echo=settings.debug,
+    echo=False,
     future=True,
 )
+if settings.sql_echo:
+    logging.getLogger("sqlalchemy.engine").setLevel(logging.INFO)
+
+SQLITE_PRAGMAS = (
+    "PRAGMA journal_mode=WAL",
+    "PRAGMA synchronous=NORMAL",
+    "PRAGMA temp_store=MEMORY",
+    "PRAGMA cache_size=-65536",
+    "PRAGMA mmap_size=268435456",
+    # Off by default in SQLite; needed for the ON DELETE CASCADE foreign keys.
+    "PRAGMA foreign_keys=ON",
+)
+
+
+if engine.dialect.name == "sqlite":
+    @event.listens_for(engine.sync_engine, "connect")
+    def _set_sqlite_pragmas(dbapi_connection, connection_record) -> None:
+        """Use WAL with relaxed fsync so log/segment writes don't serialize on commits, and enforce foreign keys."""
+        cursor = dbapi_connection.cursor()
+        for pragma in SQLITE_PRAGMAS:
+            cursor.execute(pragma)
+        cursor.close()
+
 
 AsyncSessionLocal = async_sessionmaker(
     engine,
@@ -32,11 +60,65 @@ AsyncSessionLocal = async_sessionmaker(
 )
 
 
+# Bump whenever a model change alters what is stored on disk (column types,
+# value encodings, new columns or indexes). create_all() only creates
+# missing tables, so an older database would otherwise fail at query time.
+SCHEMA_VERSION = 1
+
+
+class SchemaVersionError(RuntimeError):
+    """The database was created by an incompatible version of the models."""
+
+
+def _check_schema_version(connection) -> None:
+    """
+    Stamp a new SQLite database with SCHEMA_VERSION, or refuse an old one.
+    
+    The version lives in SQLite's ``user_version`` header field. An
+    unstamped database whose tables already have every mapped column was
+    created by the current models before stamping existed, and is stamped.
+    """
+    if connection.dialect.name != "sqlite":
+        return
+    version = connection.execute(text("PRAGMA user_version")).scalar_one()
+    if version == SCHEMA_VERSION:
+        return
+    
+    inspector = inspect(connection)
+    existing = set(inspector.get_table_names())
+    if version == 0:
+        current = all(
+            {column.name for column in table.columns}
+            <= {column["name"] for column in inspector.get_columns(table.name)}
+            for table in Base.metadata.sorted_tables
+            if table.name in existing
+        )
+        if not existing or current:
+            connection.execute(text(f"PRAGMA user_version = {SCHEMA_VERSION}"))
+            return
+    
+    raise SchemaVersionError(
+        f"Database schema version {version} does not match the expected "
+        f"version {SCHEMA_VERSION} ({settings.database_url}). Status codes, "
+        "processing log details, columns and indexes have changed; back up "
+        "and delete the database file so it is recreated on startup."
+    )
+
+
+def _create_missing_indexes(connection) -> None:
+    """Create mapped indexes that tables from an earlier create_all() lack."""
+    for table in Base.metadata.sorted_tables:
+        for index in table.indexes:
+            index.create(connection, checkfirst=True)
+
+
 async def init_db() -> None:
     """Initialize the database by creating all tables."""
     logger.info("Initializing database", database_url=settings.database_url)
     async with engine.begin() as conn:
+        await conn.run_sync(_check_schema_version)
         await conn.run_sync(Base.metadata.create_all)
+        await conn.run_sync(_create_missing_indexes)
     logger.info("Database initialized successfully")
 
 
@@ -0,0 +1,26 @@
+"""
+Custom SQLAlchemy column types.
+"""
+
+from typing import Any, Optional
+
+import msgpack
+from sqlalchemy import LargeBinary
+from sqlalchemy.types import TypeDecorator
+
+
+class MsgpackBlob(TypeDecorator):
+    """Stores a dict/list as a MessagePack-encoded BLOB."""
+    
+    impl = LargeBinary
+    cache_ok = True
+    
+    def process_bind_param(self, value: Any, dialect) -> Optional[bytes]:
+        if value is None:
+            return None
+        return msgpack.packb(value, use_bin_type=True)
+    
+    def process_result_value(self, value: Optional[bytes], dialect) -> Any:
+        if value is None:
+            return None
+        return msgpack.unpackb(value, raw=False)
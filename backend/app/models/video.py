@@ -8,21 +8,27 @@ from typing import Optional, List
 from sqlalchemy import (
     String,
     Integer,
+    SmallInteger,
+    Boolean,
     Float,
     Text,
     DateTime,
-    Enum,
     ForeignKey,
-    JSON,
+    CheckConstraint,
+    Index,
+    func,
 )
-from sqlalchemy.orm import Mapped, mapped_column, relationship
+from sqlalchemy.orm import Mapped, mapped_column, relationship, query_expression
+from sqlalchemy.types import TypeDecorator
 
 from app.models.database import Base
+from app.models.types import MsgpackBlob
 
 
 class ProcessingStatus(str, enum.Enum):
     """Status of video processing."""
     PENDING = "pending"
+    QUEUED = "queued"
     UPLOADING = "uploading"
     PROCESSING = "processing"
     SEGMENTING = "segmenting"
@@ -32,16 +38,62 @@ class ProcessingStatus(str, enum.Enum):
     FAILED = "failed"
 
 
+STATUS_CODES: dict[ProcessingStatus, str] = {
+    ProcessingStatus.PENDING: "P",
+    ProcessingStatus.QUEUED: "Q",
+    ProcessingStatus.UPLOADING: "U",
+    ProcessingStatus.PROCESSING: "R",
+    ProcessingStatus.SEGMENTING: "S",
+    ProcessingStatus.EXTRACTING_AUDIO: "A",
+    ProcessingStatus.GENERATING_THUMBNAILS: "T",
+    ProcessingStatus.COMPLETED: "C",
+    ProcessingStatus.FAILED: "F",
+}
+_CODE_STATUSES: dict[str, ProcessingStatus] = {code: status for status, code in STATUS_CODES.items()}
+
+
+class StatusCode(TypeDecorator):
+    """Stores a ProcessingStatus as its one-character code."""
+    
+    impl = String(1)
+    cache_ok = True
+    
+    def process_bind_param(self, value, dialect) -> Optional[str]:
+        if value is None:
+            return None
+        return STATUS_CODES[ProcessingStatus(value)]
+    
+    def process_result_value(self, value, dialect) -> Optional[ProcessingStatus]:
+        if value is None:
+            return None
+        return _CODE_STATUSES[value]
+
+
 class Video(Base):
     """Model representing an uploaded video."""
     
     __tablename__ = "videos"
+    __table_args__ = (
+        CheckConstraint(
+            "status IN (%s)" % ", ".join(f"'{code}'" for code in STATUS_CODES.values()),
+            name="ck_videos_status",
+        ),
+        # Listing order is (created_at DESC, id DESC), optionally filtered by
+        # status; SQLite walks these backwards for the descending order, and
+        # the status-prefixed one also serves status counts.
+        Index("ix_videos_created", "created_at", "id"),
+        Index("ix_videos_status_created", "status", "created_at", "id"),
+    )
+    # Fetch the server-generated timestamps in the INSERT/UPDATE itself
+    # (RETURNING) so reading them never needs a lazy load.
+    __mapper_args__ = {"eager_defaults": True}
     
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     filename: Mapped[str] = mapped_column(String(255), nullable=False)
     original_filename: Mapped[str] = mapped_column(String(255), nullable=False)
     file_path: Mapped[str] = mapped_column(String(512), nullable=False)
     file_size: Mapped[int] = mapped_column(Integer, nullable=False)
+    content_hash: Mapped[Optional[str]] = mapped_column(String(32), nullable=True, index=True)
     
     # Video metadata
     duration: Mapped[Optional[float]] = mapped_column(Float, nullable=True)
@@ -53,9 +105,9 @@ class Video(Base):
     
     # Processing info
     status: Mapped[ProcessingStatus] = mapped_column(
-        Enum(ProcessingStatus),
+        StatusCode,
         default=ProcessingStatus.PENDING,
-        nullable=False
+        nullable=False,
     )
     error_message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
     
@@ -67,30 +119,41 @@ class Video(Base):
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False
     )
     updated_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
-        onupdate=datetime.utcnow,
+        server_default=func.now(),
+        onupdate=func.now(),
         nullable=False
     )
     processing_started_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     processing_completed_at: Mapped[Optional[datetime]] = mapped_column(DateTime, nullable=True)
     
     # Relationships
+    # Loaded with one IN query per batch of videos (lazy loads can't run
+    # under AsyncSession), in the order the composite indexes cover.
     segments: Mapped[List["VideoSegment"]] = relationship(
         "VideoSegment",
         back_populates="video",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="selectin",
+        order_by="VideoSegment.segment_index"
     )
     processing_logs: Mapped[List["ProcessingLog"]] = relationship(
         "ProcessingLog",
         back_populates="video",
-        cascade="all, delete-orphan"
+        cascade="all, delete-orphan",
+        passive_deletes=True,
+        lazy="selectin",
+        order_by="ProcessingLog.started_at"
     )
     
+    # Only populated by queries that ask for it with with_expression().
+    segment_count: Mapped[Optional[int]] = query_expression()
+    
     def __repr__(self) -> str:
         return f"<Video(id={self.id}, filename={self.filename}, status={self.status})>"
 
@@ -99,6 +162,12 @@ class VideoSegment(Base):
     """Model representing a video segment."""
     
     __tablename__ = "video_segments"
+    # Segments are always read per video in index order; the leading
+    # video_id column also serves plain video_id lookups and the FK cascade.
+    __table_args__ = (
+        Index("ix_segment_video_idx", "video_id", "segment_index"),
+    )
+    __mapper_args__ = {"eager_defaults": True}
     
     id: Mapped[str] = mapped_column(String(36), primary_key=True)
     video_id: Mapped[str] = mapped_column(
@@ -106,7 +175,7 @@ class VideoSegment(Base):
         ForeignKey("videos.id", ondelete="CASCADE"),
         nullable=False
     )
-    segment_index: Mapped[int] = mapped_column(Integer, nullable=False)
+    segment_index: Mapped[int] = mapped_column(SmallInteger, nullable=False)
     
     # File paths
     file_path: Mapped[str] = mapped_column(String(512), nullable=False)
@@ -120,17 +189,17 @@ class VideoSegment(Base):
     
     # Processing metadata
     file_size: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
-    has_faces: Mapped[Optional[bool]] = mapped_column(Integer, nullable=True)
-    face_count: Mapped[Optional[int]] = mapped_column(Integer, nullable=True)
+    has_faces: Mapped[Optional[bool]] = mapped_column(Boolean, nullable=True)
+    face_count: Mapped[Optional[int]] = mapped_column(SmallInteger, nullable=True)
     
     # Embedding info
     embedding_id: Mapped[Optional[str]] = mapped_column(String(100), nullable=True)
-    embedding_generated: Mapped[bool] = mapped_column(Integer, default=False, nullable=False)
+    embedding_generated: Mapped[bool] = mapped_column(Boolean, default=False, nullable=False)
     
     # Timestamps
     created_at: Mapped[datetime] = mapped_column(
         DateTime,
-        default=datetime.utcnow,
+        server_default=func.now(),
         nullable=False
     )
     
@@ -145,6 +214,9 @@ class ProcessingLog(Base):
     """Model for tracking processing steps and their status."""
     
     __tablename__ = "processing_logs"
+    __table_args__ = (
+        Index("ix_processing_log_video_started", "video_id", "started_at"),
+    )
     
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     video_id: Mapped[str] = mapped_column(
@@ -157,7 +229,7 @@ class ProcessingLog(Base):
     step: Mapped[str] = mapped_column(String(100), nullable=False)
     status: Mapped[str] = mapped_column(String(50), nullable=False)
     message: Mapped[Optional[str]] = mapped_column(Text, nullable=True)
-    details: Mapped[Optional[dict]] = mapped_column(JSON, nullable=True)
+    details: Mapped[Optional[dict]] = mapped_column(MsgpackBlob, nullable=True)
     
     # Timing
     started_at: Mapped[datetime] = mapped_column(DateTime, nullable=False)
@@ -2,28 +2,66 @@
 Video API endpoints for upload, processing, and retrieval.
 """
 
-from typing import Optional
-from fastapi import APIRouter, Depends, UploadFile, File, Form, HTTPException, BackgroundTasks
+import os
+import asyncio
+import orjson
+import hashlib
+from functools import lru_cache
+from typing import AsyncIterator, Optional
+from uuid import UUID
+from fastapi import APIRouter, Depends, Request, Response, HTTPException, Query
+from fastapi import Path as FastAPIPath
+from fastapi.responses import ORJSONResponse, StreamingResponse, FileResponse
 from sqlalchemy.ext.asyncio import AsyncSession
+from streaming_form_data import StreamingFormDataParser
+from streaming_form_data.targets import ValueTarget
 
-from app.config import get_logger
-from app.models.database import get_db
+from app.config import get_settings, get_logger
+from app.models.database import get_db, AsyncSessionLocal
 from app.models.video import ProcessingStatus
-from app.services.video_service import VideoService
+from app.services.video_service import VideoService, VideoFileTarget, allowed_extension
+from app.services.chunked_upload import ChunkedUploadStore, ChunkTooLargeError
+from app.services.processing_queue import ProcessingJob
 from app.schema.video import (
     VideoUploadResponse,
+    ChunkedUploadResponse,
+    ChunkUploadResponse,
     VideoProcessingRequest,
     VideoProcessingResponse,
     VideoDetailResponse,
     VideoListResponse,
-    VideoSegmentResponse,
-    ProcessingLogResponse,
+    VideoListItemResponse,
     AgentInfoResponse,
+    SEGMENT_LIST_ADAPTER,
 )
 
 logger = get_logger("video_router")
+settings = get_settings()
 
-router = APIRouter(prefix="/videos", tags=["Videos"])
+ALLOWED_EXTENSIONS = frozenset({".mp4", ".avi", ".mov", ".mkv", ".webm"})
+_INVALID_TYPE_DETAIL = f"Invalid file type. Allowed: {', '.join(sorted(ALLOWED_EXTENSIONS))}"
+UPLOAD_FORM_FIELDS = ("camera_id", "location", "uploaded_by")
+_QUEUE_FULL_DETAIL = "Processing queue is full, retry later"
+_ASSEMBLING_DETAIL = "Upload is already being completed"
+_CHUNK_TOO_LARGE_DETAIL = f"Chunk exceeds the maximum of {settings.upload_chunk_size} bytes"
+# Body bytes handed to the multipart parser's worker thread at a time.
+UPLOAD_PARSE_BATCH = 1024 * 1024
+# Upper bound on chunks per chunked upload (16 MiB chunks -> ~160 GB).
+MAX_UPLOAD_CHUNKS = 10_000
+
+chunked_uploads = ChunkedUploadStore(
+    settings.videos_dir / ".parts",
+    write_buffer=settings.upload_write_buffer,
+    max_chunk_size=settings.upload_chunk_size,
+)
+
+# Thumbnails up to this size are served from memory after the first hit.
+THUMBNAIL_CACHE_MAX_BYTES = 256 * 1024
+
+_STATUS_VALUES: dict[str, ProcessingStatus] = {s.value: s for s in ProcessingStatus}
+_STATUS_VALUE_LIST = list(_STATUS_VALUES)
+
+router = APIRouter(prefix="/videos", tags=["Videos"], default_response_class=ORJSONResponse)
 
 
 def get_video_service(db: AsyncSession = Depends(get_db)) -> VideoService:
@@ -31,70 +69,233 @@ def get_video_service(db: AsyncSession = Depends(get_db)) -> VideoService:
     return VideoService(db)
 
 
+async def _batched(chunks: AsyncIterator[bytes], size: int) -> AsyncIterator[bytes]:
+    """Regroup a body stream into pieces of at least ``size`` bytes (bar the last)."""
+    pending: list[bytes] = []
+    pending_size = 0
+    async for chunk in chunks:
+        pending.append(chunk)
+        pending_size += len(chunk)
+        if pending_size >= size:
+            yield b"".join(pending)
+            pending, pending_size = [], 0
+    if pending:
+        yield b"".join(pending)
+
+
 @router.post("/upload", response_model=VideoUploadResponse)
 async def upload_video(
-    file: UploadFile = File(..., description="Video file to upload"),
-    camera_id: Optional[str] = Form(None, description="Camera identifier"),
-    location: Optional[str] = Form(None, description="Camera location"),
-    uploaded_by: Optional[str] = Form(None, description="Uploader identifier"),
+    request: Request,
     service: VideoService = Depends(get_video_service),
 ):
     """
     Upload a video file for processing.
     
+    Expects a multipart form with a ``file`` part and optional ``camera_id``,
+    ``location`` and ``uploaded_by`` fields. The body is parsed as it arrives
+    and the file is written straight to storage, never buffered in memory.
+    
     The video will be stored and queued for processing. Use the returned
     video_id to check status and trigger processing.
     """
+    if not request.headers.get("content-type", "").startswith("multipart/form-data"):
+        raise HTTPException(status_code=400, detail="Expected a multipart/form-data body")
+    
+    upload = VideoFileTarget(
+        settings.videos_dir,
+        ALLOWED_EXTENSIONS,
+        write_buffer=settings.upload_write_buffer,
+    )
+    fields = {name: ValueTarget() for name in UPLOAD_FORM_FIELDS}
+    
+    parser = StreamingFormDataParser(headers=request.headers)
+    parser.register("file", upload)
+    for name, target in fields.items():
+        parser.register(name, target)
+    
+    try:
+        # Parsing drives the target's file writes and hashing, so it runs on
+        # a worker thread, a batch of body chunks at a time.
+        async for batch in _batched(request.stream(), UPLOAD_PARSE_BATCH):
+            await asyncio.to_thread(parser.data_received, batch)
+            if upload.rejected:
+                # No need to read the rest of a body we're going to refuse.
+                break
+    except Exception as e:
+        upload.discard()
+        logger.error("Video upload failed", error=str(e))
+        raise HTTPException(status_code=400, detail=f"Malformed upload: {str(e)}")
+    
+    if upload.rejected:
+        raise HTTPException(status_code=400, detail=_INVALID_TYPE_DETAIL)
+    if upload.file_path is None:
+        raise HTTPException(status_code=400, detail="Missing file part")
+    
+    camera_id, location, uploaded_by = (
+        fields[name].value.decode() or None for name in UPLOAD_FORM_FIELDS
+    )
+    
     logger.info(
         "Video upload request",
-        filename=file.filename,
+        filename=upload.multipart_filename,
         camera_id=camera_id,
         location=location
     )
     
-    allowed_extensions = {".mp4", ".avi", ".mov", ".mkv", ".webm"}
-    file_ext = "." + file.filename.split(".")[-1].lower() if "." in file.filename else ""
-    
-    if file_ext not in allowed_extensions:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Invalid file type. Allowed: {', '.join(allowed_extensions)}"
-        )
-    
     try:
         video = await service.upload_video(                                    # this is the main function for uploading the video to the database and the file system note the processing doesn't start automatically here there is a seperate endpoint for this. 
-            file=file,
+            video_id=upload.video_id,
+            file_path=upload.file_path,
+            file_size=upload.file_size,
+            original_filename=upload.multipart_filename,
+            content_hash=upload.content_hash,
             camera_id=camera_id,
             location=location,
             uploaded_by=uploaded_by,
         )
         
-        return VideoUploadResponse(
-            success=True,
-            video_id=video.id,
-            filename=video.filename,
-            original_filename=video.original_filename,
-            file_size=video.file_size,
-            status=video.status.value,
-            message="Video uploaded successfully. Ready for processing.",
-            created_at=video.created_at,
-        )
+        return _upload_response(video)
         
     except Exception as e:
         logger.error("Video upload failed", error=str(e))
         raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
 
 
+def _upload_response(video) -> VideoUploadResponse:
+    return VideoUploadResponse(
+        success=True,
+        video_id=video.id,
+        filename=video.filename,
+        original_filename=video.original_filename,
+        file_size=video.file_size,
+        status=video.status,
+        message="Video uploaded successfully. Ready for processing.",
+        created_at=video.created_at,
+    )
+
+
+def _get_chunked_upload_or_404(upload_id: UUID) -> str:
+    upload_id = str(upload_id)
+    if not chunked_uploads.exists(upload_id):
+        if chunked_uploads.is_assembling(upload_id):
+            raise HTTPException(status_code=409, detail=_ASSEMBLING_DETAIL)
+        raise HTTPException(status_code=404, detail=f"Upload not found: {upload_id}")
+    return upload_id
+
+
+@router.post("/uploads", response_model=ChunkedUploadResponse, status_code=201)
+async def start_chunked_upload():
+    """
+    Start a chunked upload for a large video.
+    
+    Send the file as numbered chunks to PUT /uploads/{upload_id}/chunks/{index}
+    (in any order, several at a time), then call POST
+    /uploads/{upload_id}/complete to assemble them into a video. A failed
+    chunk can simply be sent again.
+    """
+    upload_id = await asyncio.to_thread(chunked_uploads.create)
+    return ChunkedUploadResponse(upload_id=upload_id, chunk_size=settings.upload_chunk_size)
+
+
+@router.put("/uploads/{upload_id}/chunks/{index}", response_model=ChunkUploadResponse)
+async def upload_chunk(
+    upload_id: UUID,
+    request: Request,
+    index: int = FastAPIPath(..., ge=0, lt=MAX_UPLOAD_CHUNKS),
+):
+    """
+    Store one chunk of a chunked upload; the raw request body is the chunk.
+    
+    Chunks larger than the chunk_size returned by POST /uploads get 413.
+    """
+    upload_id = _get_chunked_upload_or_404(upload_id)
+    content_length = request.headers.get("content-length", "")
+    if content_length.isdigit() and int(content_length) > settings.upload_chunk_size:
+        raise HTTPException(status_code=413, detail=_CHUNK_TOO_LARGE_DETAIL)
+    try:
+        size = await chunked_uploads.write_chunk(upload_id, index, request.stream())
+    except ChunkTooLargeError:
+        raise HTTPException(status_code=413, detail=_CHUNK_TOO_LARGE_DETAIL)
+    return ChunkUploadResponse(upload_id=upload_id, index=index, size=size)
+
+
+@router.post("/uploads/{upload_id}/complete", response_model=VideoUploadResponse)
+async def complete_chunked_upload(
+    upload_id: UUID,
+    filename: str,
+    chunk_count: int = Query(..., ge=1, le=MAX_UPLOAD_CHUNKS),
+    camera_id: Optional[str] = None,
+    location: Optional[str] = None,
+    uploaded_by: Optional[str] = None,
+    service: VideoService = Depends(get_video_service),
+):
+    """
+    Assemble chunks 0..chunk_count-1 into a video and register it.
+    
+    The resulting video has the upload's ID and behaves exactly like one
+    sent to POST /upload.
+    """
+    upload_id = _get_chunked_upload_or_404(upload_id)
+    extension = allowed_extension(filename, ALLOWED_EXTENSIONS)
+    if extension is None:
+        raise HTTPException(status_code=400, detail=_INVALID_TYPE_DETAIL)
+    
+    missing = await asyncio.to_thread(chunked_uploads.missing_chunks, upload_id, chunk_count)
+    if missing:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Missing chunks: {missing[:20]}{' ...' if len(missing) > 20 else ''}"
+        )
+    
+    # Only one complete call gets past the claim; a retry that overlaps a
+    # slow assembly is refused instead of writing the same file.
+    if not await asyncio.to_thread(chunked_uploads.claim, upload_id):
+        raise HTTPException(status_code=409, detail=_ASSEMBLING_DETAIL)
+    
+    file_path = settings.videos_dir / f"{upload_id}{extension}"
+    try:
+        file_size = await asyncio.to_thread(chunked_uploads.assemble, upload_id, chunk_count, file_path)
+        video = await service.upload_video(
+            video_id=upload_id,
+            file_path=file_path,
+            file_size=file_size,
+            original_filename=filename,
+            camera_id=camera_id,
+            location=location,
+            uploaded_by=uploaded_by,
+        )
+    except BaseException as e:
+        # Keep the parts so the client can call complete again.
+        file_path.unlink(missing_ok=True)
+        chunked_uploads.release(upload_id)
+        if not isinstance(e, Exception):
+            raise
+        logger.error("Chunked upload failed", upload_id=upload_id, error=str(e))
+        raise HTTPException(status_code=500, detail=f"Upload failed: {str(e)}")
+    
+    await asyncio.to_thread(chunked_uploads.finish, upload_id)
+    return _upload_response(video)
+
+
+@router.delete("/uploads/{upload_id}", status_code=204)
+async def abort_chunked_upload(upload_id: UUID):
+    """Abandon a chunked upload and delete the chunks received so far."""
+    upload_id = _get_chunked_upload_or_404(upload_id)
+    await asyncio.to_thread(chunked_uploads.discard, upload_id)
+
+
 @router.post("/{video_id}/process", response_model=VideoProcessingResponse)
 async def process_video(
     video_id: str,
+    request: Request,
+    response: Response,
     camera_id: Optional[str] = None,
     location: Optional[str] = None,
-    background_tasks: BackgroundTasks = None,
+    include_segments: bool = True,
     service: VideoService = Depends(get_video_service),
 ):
     """
-    Process an uploaded video using the Video Processing Agent.
+    Queue an uploaded video for processing by the Video Processing Agent.
     
     This will:
     1. Analyze video metadata
@@ -102,7 +303,10 @@ async def process_video(
     3. Extract audio track
     4. Generate thumbnails for each segment
     
-    Processing runs synchronously and returns results when complete.
+    Processing runs on a background worker; the request returns 202 with
+    status "queued" straight away, or 503 if the processing queue is full.
+    Poll GET /videos/{video_id} for progress. For an already processed
+    video, pass include_segments=false to get just the segment count.
     """
     logger.info(
         "Video processing request",
@@ -111,150 +315,181 @@ async def process_video(
         location=location
     )
     
-    video = await service.get_video(video_id)
-    if not video:
+    queue = request.app.state.processing_queue
+    if queue.full():
+        raise HTTPException(status_code=503, detail=_QUEUE_FULL_DETAIL)
+    
+    if await service.try_claim_for_processing(video_id):
+        # Commit before a worker picks it up so its own session sees the new status.
+        await service.db.commit()
+        try:
+            queue.submit(ProcessingJob(video_id, camera_id, location))
+        except asyncio.QueueFull:
+            # Filled up while we were committing the claim.
+            await service.release_claim(video_id)
+            await service.db.commit()
+            raise HTTPException(status_code=503, detail=_QUEUE_FULL_DETAIL)
+        
+        response.status_code = 202
+        return VideoProcessingResponse(
+            success=True,
+            video_id=video_id,
+            status=ProcessingStatus.QUEUED,
+            message="Video queued for processing",
+            segments=[],
+            segment_count=0,
+        )
+    
+    status = await service.get_video_status(video_id)
+    if status is None:
         raise HTTPException(status_code=404, detail=f"Video not found: {video_id}")
     
-    if video.status == ProcessingStatus.PROCESSING:                                   # prevents the same video from being processed multiple times. 
+    if status != ProcessingStatus.COMPLETED:                                          # prevents the same video from being processed multiple times. 
         raise HTTPException(
             status_code=409,
             detail="Video is already being processed"
         )
     
-    if video.status == ProcessingStatus.COMPLETED:                                    # prevents the same video from being processed multiple times. 
-        return VideoProcessingResponse(
-            success=True,
-            video_id=video_id,
-            status=video.status.value,
-            message="Video has already been processed",
-            segments=[
-                VideoSegmentResponse(
-                    id=seg.id,
-                    segment_index=seg.segment_index,
-                    file_path=seg.file_path,
-                    thumbnail_path=seg.thumbnail_path,
-                    audio_path=seg.audio_path,
-                    start_time=seg.start_time,
-                    end_time=seg.end_time,
-                    duration=seg.duration,
-                    file_size=seg.file_size,
-                    has_faces=seg.has_faces,
-                    face_count=seg.face_count,
-                    embedding_generated=seg.embedding_generated,
-                )
-                for seg in video.segments
-            ],
-            segment_count=len(video.segments),
-        )
+    video = await service.get_video(video_id)
+    return VideoProcessingResponse(
+        success=True,
+        video_id=video_id,
+        status=status,
+        message="Video has already been processed",
+        segments=(
+            SEGMENT_LIST_ADAPTER.validate_python(video.segments, from_attributes=True)
+            if include_segments else []
+        ),
+        segment_count=len(video.segments),
+    )
 
-        
-        # this is the place where the main code starts for the porcessing if the video is queued for processing. 
 
+def _etag_matches(request: Request, etag: str) -> bool:
+    """Whether the request's If-None-Match already names this ETag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    return if_none_match.strip() == "*" or etag in (t.strip() for t in if_none_match.split(","))
 
-    try:
-        result = await service.process_video(                                    # this is the main function for processing the video, which in turn is calling the agent to process the video. 
-            video_id=video_id,
-            camera_id=camera_id,
-            location=location,
+
+def _parse_status_filter(status: Optional[str]) -> Optional[ProcessingStatus]:
+    """Map a ?status= query value to ProcessingStatus, or 400."""
+    if not status:
+        return None
+    status_filter = _STATUS_VALUES.get(status)
+    if status_filter is None:
+        raise HTTPException(
+            status_code=400,
+            detail=f"Invalid status. Valid values: {_STATUS_VALUE_LIST}"
         )
-        
-        video = await service.get_video(video_id)
-        
-        return VideoProcessingResponse(
-            success=result.get("success", False),
-            video_id=video_id,
-            status=video.status.value if video else "unknown",
-            message="Video processing completed" if result.get("success") else "Processing failed",
-            segments=[
-                VideoSegmentResponse(
-                    id=seg.id,
-                    segment_index=seg.segment_index,
-                    file_path=seg.file_path,
-                    thumbnail_path=seg.thumbnail_path,
-                    audio_path=seg.audio_path,
-                    start_time=seg.start_time,
-                    end_time=seg.end_time,
-                    duration=seg.duration,
-                    file_size=seg.file_size,
-                    has_faces=seg.has_faces,
-                    face_count=seg.face_count,
-                    embedding_generated=seg.embedding_generated,
-                )
-                for seg in (video.segments if video else [])
-            ],
-            segment_count=len(video.segments) if video else 0,
-            processing_time_seconds=result.get("processing_time_seconds"),
-            agent_response=result.get("agent_response"),
-            error=result.get("error"),
+    return status_filter
+
+
+async def _video_ndjson(status_filter: Optional[ProcessingStatus]):
+    """Encode videos as NDJSON lines while they stream out of the database."""
+    # The request-scoped session is closed before the body is sent.
+    async with AsyncSessionLocal() as db:
+        async for video in VideoService(db).stream_videos(status=status_filter):
+            yield orjson.dumps(VideoListItemResponse.model_validate(video).model_dump()) + b"\n"
+
+
+@router.get("/export.ndjson", response_model=None)
+async def export_videos(status: Optional[str] = None):
+    """
+    Stream every video as newline-delimited JSON (one summary per line).
+    
+    Unlike the paged list endpoint, nothing is buffered: lines are sent as
+    rows are read, so memory stays flat however many videos there are.
+    """
+    status_filter = _parse_status_filter(status)
+    return StreamingResponse(_video_ndjson(status_filter), media_type="application/x-ndjson")
+
+
+@lru_cache(maxsize=512)
+def _thumbnail_bytes(path: str, size: int, mtime_ns: int) -> bytes:
+    """Read a small thumbnail; size/mtime in the key invalidate rewritten files."""
+    with open(path, "rb") as f:
+        return f.read()
+
+
+async def _get_segment_or_404(service: VideoService, video_id: str, segment_index: int):
+    """Look up a segment row or raise 404."""
+    segment = await service.get_segment(video_id, segment_index)
+    if segment is None:
+        raise HTTPException(
+            status_code=404,
+            detail=f"Segment {segment_index} not found for video: {video_id}"
         )
-        
-    except Exception as e:
-        logger.error("Video processing failed", video_id=video_id, error=str(e))
-        raise HTTPException(status_code=500, detail=f"Processing failed: {str(e)}")
+    return segment
+
+
+@router.get("/{video_id}/segments/{segment_index}/video", response_model=None)
+async def get_segment_video(
+    video_id: str,
+    segment_index: int,
+    service: VideoService = Depends(get_video_service),
+):
+    """Serve a segment's MP4 (sent with sendfile, Range requests supported)."""
+    segment = await _get_segment_or_404(service, video_id, segment_index)
+    if not os.path.exists(segment.file_path):
+        raise HTTPException(status_code=404, detail="Segment file is missing")
+    return FileResponse(segment.file_path, media_type="video/mp4")
+
+
+@router.get("/{video_id}/segments/{segment_index}/thumbnail", response_model=None)
+async def get_segment_thumbnail(
+    video_id: str,
+    segment_index: int,
+    service: VideoService = Depends(get_video_service),
+):
+    """Serve a segment's thumbnail JPEG."""
+    segment = await _get_segment_or_404(service, video_id, segment_index)
+    if not segment.thumbnail_path:
+        raise HTTPException(status_code=404, detail="Segment has no thumbnail")
+    try:
+        stat = os.stat(segment.thumbnail_path)
+    except FileNotFoundError:
+        raise HTTPException(status_code=404, detail="Thumbnail file is missing")
+    
+    if stat.st_size <= THUMBNAIL_CACHE_MAX_BYTES:
+        content = _thumbnail_bytes(segment.thumbnail_path, stat.st_size, stat.st_mtime_ns)
+        return Response(content, media_type="image/jpeg")
+    return FileResponse(segment.thumbnail_path, media_type="image/jpeg", stat_result=stat)
 
 
 @router.get("/{video_id}", response_model=VideoDetailResponse)
 async def get_video(
     video_id: str,
+    request: Request,
+    response: Response,
     service: VideoService = Depends(get_video_service),
 ):
-    """Get detailed information about a video."""
+    """
+    Get detailed information about a video.
+    
+    Responses carry a weak ETag; a matching If-None-Match gets a 304 and
+    skips serialization entirely.
+    """
     video = await service.get_video(video_id)
     if not video:
         raise HTTPException(status_code=404, detail=f"Video not found: {video_id}")
     
-    return VideoDetailResponse(
-        id=video.id,
-        filename=video.filename,
-        original_filename=video.original_filename,
-        file_path=video.file_path,
-        file_size=video.file_size,
-        duration=video.duration,
-        width=video.width,
-        height=video.height,
-        fps=video.fps,
-        codec=video.codec,
-        bitrate=video.bitrate,
-        status=video.status.value,
-        error_message=video.error_message,
-        camera_id=video.camera_id,
-        location=video.location,
-        uploaded_by=video.uploaded_by,
-        created_at=video.created_at,
-        updated_at=video.updated_at,
-        processing_started_at=video.processing_started_at,
-        processing_completed_at=video.processing_completed_at,
-        segments=[
-            VideoSegmentResponse(
-                id=seg.id,
-                segment_index=seg.segment_index,
-                file_path=seg.file_path,
-                thumbnail_path=seg.thumbnail_path,
-                audio_path=seg.audio_path,
-                start_time=seg.start_time,
-                end_time=seg.end_time,
-                duration=seg.duration,
-                file_size=seg.file_size,
-                has_faces=seg.has_faces,
-                face_count=seg.face_count,
-                embedding_generated=seg.embedding_generated,
-            )
-            for seg in video.segments
-        ],
-        processing_logs=[
-            ProcessingLogResponse(
-                id=log.id,
-                step=log.step,
-                status=log.status,
-                message=log.message,
-                details=log.details,
-                started_at=log.started_at,
-                completed_at=log.completed_at,
-                duration_ms=log.duration_ms,
-            )
-            for log in video.processing_logs
-        ],
+    # updated_at has second resolution, so the log count covers steps
+    # recorded within the same second as the last update.
+    etag = (
+        f'W/"{video.id}-{int(video.updated_at.timestamp())}'
+        f'-{video.status.value}-{len(video.processing_logs)}"'
     )
+    # Only finished videos stop changing; anything else must revalidate
+    # so pollers see progress.
+    cache_control = "private, max-age=60" if video.status == ProcessingStatus.COMPLETED else "private, no-cache"
+    
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag, "Cache-Control": cache_control})
+    
+    response.headers["ETag"] = etag
+    response.headers["Cache-Control"] = cache_control
+    return VideoDetailResponse.model_validate(video)
 
 
 @router.get("/", response_model=VideoListResponse)
@@ -262,84 +497,33 @@ async def list_videos(
     page: int = 1,
     page_size: int = 20,
     status: Optional[str] = None,
+    after: Optional[str] = None,
     service: VideoService = Depends(get_video_service),
 ):
-    """List all videos with pagination."""
-    status_filter = None
-    if status:
-        try:
-            status_filter = ProcessingStatus(status)
-        except ValueError:
-            raise HTTPException(
-                status_code=400,
-                detail=f"Invalid status. Valid values: {[s.value for s in ProcessingStatus]}"
-            )
-    
-    videos, total = await service.list_videos(
-        page=page,
-        page_size=page_size,
-        status=status_filter,
-    )
+    """
+    List videos with pagination (summaries only; fetch a video for its segments and logs).
+    
+    For deep pages, follow ``next_cursor`` with ?after= instead of
+    incrementing ``page``; it costs the same however far in you are.
+    """
+    status_filter = _parse_status_filter(status)
+    
+    try:
+        videos, total = await service.list_videos(
+            page=page,
+            page_size=page_size,
+            status=status_filter,
+            after=after,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
     
     return VideoListResponse(
-        videos=[
-            VideoDetailResponse(
-                id=video.id,
-                filename=video.filename,
-                original_filename=video.original_filename,
-                file_path=video.file_path,
-                file_size=video.file_size,
-                duration=video.duration,
-                width=video.width,
-                height=video.height,
-                fps=video.fps,
-                codec=video.codec,
-                bitrate=video.bitrate,
-                status=video.status.value,
-                error_message=video.error_message,
-                camera_id=video.camera_id,
-                location=video.location,
-                uploaded_by=video.uploaded_by,
-                created_at=video.created_at,
-                updated_at=video.updated_at,
-                processing_started_at=video.processing_started_at,
-                processing_completed_at=video.processing_completed_at,
-                segments=[
-                    VideoSegmentResponse(
-                        id=seg.id,
-                        segment_index=seg.segment_index,
-                        file_path=seg.file_path,
-                        thumbnail_path=seg.thumbnail_path,
-                        audio_path=seg.audio_path,
-                        start_time=seg.start_time,
-                        end_time=seg.end_time,
-                        duration=seg.duration,
-                        file_size=seg.file_size,
-                        has_faces=seg.has_faces,
-                        face_count=seg.face_count,
-                        embedding_generated=seg.embedding_generated,
-                    )
-                    for seg in video.segments
-                ],
-                processing_logs=[
-                    ProcessingLogResponse(
-                        id=log.id,
-                        step=log.step,
-                        status=log.status,
-                        message=log.message,
-                        details=log.details,
-                        started_at=log.started_at,
-                        completed_at=log.completed_at,
-                        duration_ms=log.duration_ms,
-                    )
-                    for log in video.processing_logs
-                ],
-            )
-            for video in videos
-        ],
+        videos=[VideoListItemResponse.model_validate(video) for video in videos],
         total=total,
         page=page,
         page_size=page_size,
+        next_cursor=videos[-1].id if len(videos) == page_size else None,
     )
 
 
@@ -356,10 +540,23 @@ async def delete_video(
     return {"success": True, "message": f"Video {video_id} deleted successfully"}
 
 
+@lru_cache(maxsize=1)
+def _agent_info_bytes() -> tuple[bytes, str]:
+    """
+    Agent info is fixed for the life of the process; validate and encode it once.
+    
+    Returns:
+        Tuple of (JSON body, ETag)
+    """
+    info = AgentInfoResponse(**VideoService.get_agent_info())
+    body = orjson.dumps(info.model_dump())
+    return body, f'"{hashlib.blake2b(body, digest_size=8).hexdigest()}"'
+
+
 @router.get("/agent/info", response_model=AgentInfoResponse)
-async def get_agent_info(
-    service: VideoService = Depends(get_video_service),
-):
+async def get_agent_info(request: Request):
     """Get information about the Video Processing Agent."""
-    info = service.get_agent_info()
-    return AgentInfoResponse(**info)
+    body, etag = _agent_info_bytes()
+    if _etag_matches(request, etag):
+        return Response(status_code=304, headers={"ETag": etag})
+    return Response(body, media_type="application/json", headers={"ETag": etag})
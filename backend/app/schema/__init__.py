@@ -4,22 +4,28 @@ Pydantic schemas for API request/response validation.
 
 from app.schema.video import (
     VideoUploadResponse,
+    ChunkedUploadResponse,
+    ChunkUploadResponse,
     VideoMetadata,
     VideoProcessingRequest,
     VideoProcessingResponse,
     VideoSegmentResponse,
     VideoListResponse,
+    VideoListItemResponse,
     VideoDetailResponse,
     ProcessingLogResponse,
 )
 
 __all__ = [
     "VideoUploadResponse",
+    "ChunkedUploadResponse",
+    "ChunkUploadResponse",
     "VideoMetadata",
     "VideoProcessingRequest",
     "VideoProcessingResponse",
     "VideoSegmentResponse",
     "VideoListResponse",
+    "VideoListItemResponse",
     "VideoDetailResponse",
     "ProcessingLogResponse",
 ]
@@ -4,7 +4,7 @@ Pydantic schemas for video-related API endpoints.
 
 from datetime import datetime
 from typing import Optional, List, Any
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, Field, TypeAdapter
 
 
 class VideoMetadata(BaseModel):
@@ -31,6 +31,19 @@ class VideoUploadResponse(BaseModel):
     created_at: datetime = Field(..., description="Upload timestamp")
 
 
+class ChunkedUploadResponse(BaseModel):
+    """Response after starting a chunked upload."""
+    upload_id: str = Field(..., description="ID to send chunks and the complete call to")
+    chunk_size: int = Field(..., description="Suggested chunk size in bytes")
+
+
+class ChunkUploadResponse(BaseModel):
+    """Response after storing one chunk of a chunked upload."""
+    upload_id: str = Field(..., description="Chunked upload ID")
+    index: int = Field(..., description="Chunk index")
+    size: int = Field(..., description="Chunk size in bytes")
+
+
 class VideoProcessingRequest(BaseModel):
     """Request to process a video."""
     video_id: str = Field(..., description="Video ID to process")
@@ -53,6 +66,13 @@ class VideoSegmentResponse(BaseModel):
     has_faces: Optional[bool] = Field(None, description="Whether faces were detected")
     face_count: Optional[int] = Field(None, description="Number of faces detected")
     embedding_generated: bool = Field(False, description="Whether embedding was generated")
+    
+    class Config:
+        from_attributes = True
+
+
+# Validates a whole list of ORM segments in one pydantic-core call.
+SEGMENT_LIST_ADAPTER = TypeAdapter(List[VideoSegmentResponse])
 
 
 class ProcessingLogResponse(BaseModel):
@@ -65,6 +85,9 @@ class ProcessingLogResponse(BaseModel):
     started_at: datetime = Field(..., description="Step start time")
     completed_at: Optional[datetime] = Field(None, description="Step completion time")
     duration_ms: Optional[int] = Field(None, description="Step duration in milliseconds")
+    
+    class Config:
+        from_attributes = True
 
 
 class VideoProcessingResponse(BaseModel):
@@ -88,6 +111,7 @@ class VideoDetailResponse(BaseModel):
     original_filename: str = Field(..., description="Original filename")
     file_path: str = Field(..., description="Path to video file")
     file_size: int = Field(..., description="File size in bytes")
+    content_hash: Optional[str] = Field(None, description="BLAKE2b-128 digest of the file")
     
     # Metadata
     duration: Optional[float] = Field(None, description="Duration in seconds")
@@ -120,12 +144,54 @@ class VideoDetailResponse(BaseModel):
         from_attributes = True
 
 
+class VideoListItemResponse(BaseModel):
+    """Summary of a video for list views (no segments or logs)."""
+    id: str = Field(..., description="Video ID")
+    filename: str = Field(..., description="Stored filename")
+    original_filename: str = Field(..., description="Original filename")
+    file_path: str = Field(..., description="Path to video file")
+    file_size: int = Field(..., description="File size in bytes")
+    content_hash: Optional[str] = Field(None, description="BLAKE2b-128 digest of the file")
+    
+    # Metadata
+    duration: Optional[float] = Field(None, description="Duration in seconds")
+    width: Optional[int] = Field(None, description="Width in pixels")
+    height: Optional[int] = Field(None, description="Height in pixels")
+    fps: Optional[float] = Field(None, description="Frames per second")
+    codec: Optional[str] = Field(None, description="Video codec")
+    bitrate: Optional[int] = Field(None, description="Bitrate in bps")
+    
+    # Status
+    status: str = Field(..., description="Processing status")
+    error_message: Optional[str] = Field(None, description="Error message if failed")
+    
+    # User metadata
+    camera_id: Optional[str] = Field(None, description="Camera identifier")
+    location: Optional[str] = Field(None, description="Camera location")
+    uploaded_by: Optional[str] = Field(None, description="Uploader identifier")
+    
+    # Timestamps
+    created_at: datetime = Field(..., description="Upload timestamp")
+    updated_at: datetime = Field(..., description="Last update timestamp")
+    processing_started_at: Optional[datetime] = Field(None, description="Processing start time")
+    processing_completed_at: Optional[datetime] = Field(None, description="Processing completion time")
+    
+    segment_count: int = Field(0, description="Number of segments")
+    
+    class Config:
+        from_attributes = True
+
+
 class VideoListResponse(BaseModel):
     """Response for listing videos."""
-    videos: List[VideoDetailResponse] = Field(..., description="List of videos")
+    videos: List[VideoListItemResponse] = Field(..., description="List of videos")
     total: int = Field(..., description="Total number of videos")
     page: int = Field(1, description="Current page")
     page_size: int = Field(20, description="Page size")
+    next_cursor: Optional[str] = Field(
+        None,
+        description="Pass as ?after= to fetch the next page; null on the last page",
+    )
 
 
 class AgentInfoResponse(BaseModel):
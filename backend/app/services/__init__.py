@@ -3,7 +3,12 @@ Business logic services for ChronoTrace.
 """
 
 from app.services.video_service import VideoService
+from app.services.processing_queue import ProcessingQueue, ProcessingJob
+from app.services.chunked_upload import ChunkedUploadStore
 
 __all__ = [
     "VideoService",
+    "ProcessingQueue",
+    "ProcessingJob",
+    "ChunkedUploadStore",
 ]
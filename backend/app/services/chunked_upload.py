@@ -0,0 +1,235 @@
+"""
+Storage for videos uploaded as independently sent, numbered chunks.
+"""
+
+import os
+import time
+import uuid
+import asyncio
+import shutil
+from pathlib import Path
+from typing import AsyncIterator, BinaryIO, Optional
+
+from app.config import get_logger
+
+logger = get_logger("chunked_upload")
+
+
+class ChunkTooLargeError(Exception):
+    """A chunk's body exceeded the store's maximum chunk size."""
+
+
+class ChunkedUploadStore:
+    """
+    Keeps the parts of in-progress chunked uploads under ``root``.
+
+    Each upload gets its own directory holding ``<index>.part`` files.
+    Chunks may arrive in any order and in parallel; a chunk only appears
+    under its final name once it has been fully written, so a retried or
+    interrupted chunk never leaves a truncated part behind.
+
+    Completing an upload first claims it by renaming its directory to
+    ``<upload_id>.assembling``; only one caller can win that rename, so
+    overlapping completes never write the same file. The parts are kept
+    until the caller finishes the claim, and releasing it puts them back.
+
+    Chunks larger than ``max_chunk_size`` are refused, and uploads that see
+    no new chunk for a while can be dropped with expire().
+    """
+
+    def __init__(
+        self,
+        root: Path,
+        write_buffer: int = 8 * 1024 * 1024,
+        max_chunk_size: Optional[int] = None,
+    ):
+        self.root = root
+        self.write_buffer = write_buffer
+        self.max_chunk_size = max_chunk_size
+
+    def _parts_dir(self, upload_id: str) -> Path:
+        return self.root / upload_id
+
+    def _assembling_dir(self, upload_id: str) -> Path:
+        return self.root / f"{upload_id}.assembling"
+
+    def create(self) -> str:
+        """Start a new upload and return its ID."""
+        upload_id = str(uuid.uuid4())
+        self._parts_dir(upload_id).mkdir(parents=True)
+        return upload_id
+
+    def exists(self, upload_id: str) -> bool:
+        return self._parts_dir(upload_id).is_dir()
+
+    def is_assembling(self, upload_id: str) -> bool:
+        return self._assembling_dir(upload_id).is_dir()
+
+    async def write_chunk(
+        self,
+        upload_id: str,
+        index: int,
+        chunks: AsyncIterator[bytes],
+    ) -> int:
+        """
+        Stream one chunk's body to its part file.
+
+        The body is gathered in memory up to ``write_buffer`` bytes at a
+        time, and each batch is written from a worker thread so the disk
+        I/O stays off the event loop.
+
+        Returns:
+            Size of the chunk in bytes
+
+        Raises:
+            ChunkTooLargeError: If the body exceeds ``max_chunk_size``; the
+                partial part is removed
+        """
+        part_path = self._parts_dir(upload_id) / f"{index}.part"
+        tmp_path = part_path.with_suffix(f".tmp{uuid.uuid4().hex[:8]}")
+        size = 0
+        try:
+            fd = await asyncio.to_thread(open, tmp_path, "wb")
+            try:
+                pending = bytearray()
+                async for chunk in chunks:
+                    pending += chunk
+                    size += len(chunk)
+                    if self.max_chunk_size is not None and size > self.max_chunk_size:
+                        raise ChunkTooLargeError(
+                            f"Chunk exceeds the maximum of {self.max_chunk_size} bytes"
+                        )
+                    if len(pending) >= self.write_buffer:
+                        batch, pending = pending, bytearray()
+                        await asyncio.to_thread(fd.write, batch)
+                if pending:
+                    await asyncio.to_thread(fd.write, pending)
+            finally:
+                await asyncio.to_thread(fd.close)
+            await asyncio.to_thread(os.replace, tmp_path, part_path)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        return size
+
+    def missing_chunks(self, upload_id: str, chunk_count: int) -> list[int]:
+        """Indexes in ``range(chunk_count)`` that have not been received."""
+        parts_dir = self._parts_dir(upload_id)
+        return [i for i in range(chunk_count) if not (parts_dir / f"{i}.part").exists()]
+
+    def claim(self, upload_id: str) -> bool:
+        """
+        Take the upload for assembly; False if it is gone or already claimed.
+
+        Chunks sent after this point are refused, as the upload no longer
+        exists under its own name.
+        """
+        try:
+            os.rename(self._parts_dir(upload_id), self._assembling_dir(upload_id))
+        except FileNotFoundError:
+            return False
+        return True
+
+    def assemble(self, upload_id: str, chunk_count: int, target: Path) -> int:
+        """
+        Concatenate a claimed upload's parts, in order, into ``target``.
+
+        The file is written under a temporary name and moved into place
+        whole. Blocking; run it in a thread.
+
+        Returns:
+            Size of the assembled file in bytes
+        """
+        parts_dir = self._assembling_dir(upload_id)
+        tmp_path = target.with_name(f".{target.name}.{uuid.uuid4().hex[:8]}.tmp")
+        try:
+            with open(tmp_path, "wb", buffering=0) as out:
+                for index in range(chunk_count):
+                    with open(parts_dir / f"{index}.part", "rb") as part:
+                        _append_file(out, part)
+                size = out.tell()
+            os.replace(tmp_path, target)
+        except BaseException:
+            tmp_path.unlink(missing_ok=True)
+            raise
+        logger.info("Chunked upload assembled", upload_id=upload_id, chunks=chunk_count, size=size)
+        return size
+
+    def finish(self, upload_id: str) -> None:
+        """Drop a claimed upload's parts once its video is registered."""
+        shutil.rmtree(self._assembling_dir(upload_id), ignore_errors=True)
+
+    def release(self, upload_id: str) -> None:
+        """Return a claimed upload to its parts so it can be completed again."""
+        os.rename(self._assembling_dir(upload_id), self._parts_dir(upload_id))
+
+    def discard(self, upload_id: str) -> None:
+        """Delete an upload's parts."""
+        shutil.rmtree(self._parts_dir(upload_id), ignore_errors=True)
+
+    def recover(self) -> int:
+        """
+        Release claims left by a process that stopped mid-assembly.
+
+        Only safe at startup, while no complete call can be running.
+
+        Returns:
+            Number of uploads released
+        """
+        released = 0
+        for path in self.root.glob("*.assembling"):
+            self.release(path.name.removesuffix(".assembling"))
+            released += 1
+        return released
+
+    def expire(self, max_age: float) -> int:
+        """
+        Delete uploads that have received no chunk for ``max_age`` seconds.
+
+        A parts directory's mtime moves whenever a part lands in it, so it
+        marks the upload's last activity. Claimed uploads are left alone.
+
+        Returns:
+            Number of uploads deleted
+        """
+        cutoff = time.time() - max_age
+        expired = 0
+        try:
+            entries = list(os.scandir(self.root))
+        except FileNotFoundError:
+            return 0
+        for entry in entries:
+            if (
+                entry.is_dir(follow_symlinks=False)
+                and not entry.name.endswith(".assembling")
+                and entry.stat(follow_symlinks=False).st_mtime < cutoff
+            ):
+                shutil.rmtree(entry.path, ignore_errors=True)
+                expired += 1
+        if expired:
+            logger.info("Expired abandoned chunked uploads", count=expired)
+        return expired
+
+
+async def expire_periodically(store: ChunkedUploadStore, max_age: float) -> None:
+    """Run ``store.expire(max_age)`` now and then until cancelled."""
+    interval = min(max_age, 3600)
+    while True:
+        await asyncio.to_thread(store.expire, max_age)
+        await asyncio.sleep(interval)
+
+
+def _append_file(out: BinaryIO, part: BinaryIO) -> None:
+    """Append ``part`` to ``out``, in-kernel where the platform allows it."""
+    size = os.fstat(part.fileno()).st_size
+    offset = 0
+    try:
+        while offset < size:
+            sent = os.sendfile(out.fileno(), part.fileno(), offset, size - offset)
+            if sent == 0:
+                break
+            offset += sent
+    except (AttributeError, OSError):
+        # No sendfile, or one that only writes to sockets (macOS).
+        part.seek(offset)
+        shutil.copyfileobj(part, out)
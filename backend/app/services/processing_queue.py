@@ -0,0 +1,98 @@
+"""
+Bounded in-process queue feeding a fixed set of video processing workers.
+"""
+
+import asyncio
+from dataclasses import dataclass
+from typing import Optional
+
+from app.config import get_logger
+from app.models.database import AsyncSessionLocal
+from app.services.video_service import VideoService
+
+logger = get_logger("processing_queue")
+
+
+@dataclass(frozen=True)
+class ProcessingJob:
+    """A claimed video waiting for a worker."""
+
+    video_id: str
+    camera_id: Optional[str] = None
+    location: Optional[str] = None
+
+
+class ProcessingQueue:
+    """
+    Fixed-capacity job queue drained by ``concurrency`` worker tasks.
+
+    Submitting never waits: once the queue is full, submit() raises
+    asyncio.QueueFull so the API can push back instead of piling up work.
+    """
+
+    def __init__(self, capacity: int, concurrency: int):
+        self._queue: asyncio.Queue[ProcessingJob] = asyncio.Queue(maxsize=capacity)
+        self._concurrency = concurrency
+        self._workers: list[asyncio.Task] = []
+
+    def full(self) -> bool:
+        return self._queue.full()
+
+    def submit(self, job: ProcessingJob) -> None:
+        """Enqueue a job; raises asyncio.QueueFull if there is no room."""
+        self._queue.put_nowait(job)
+
+    def start(self) -> None:
+        """Spawn the worker tasks."""
+        self._workers = [
+            asyncio.create_task(self._worker(), name=f"video-processing-{n}")
+            for n in range(self._concurrency)
+        ]
+        logger.info(
+            "Processing workers started",
+            concurrency=self._concurrency,
+            capacity=self._queue.maxsize,
+        )
+
+    async def stop(self) -> None:
+        """
+        Cancel the workers.
+        
+        A video being processed is marked FAILED; jobs still queued stay
+        QUEUED and are reset to PENDING on the next startup.
+        """
+        for worker in self._workers:
+            worker.cancel()
+        await asyncio.gather(*self._workers, return_exceptions=True)
+        self._workers = []
+
+    async def _worker(self) -> None:
+        while True:
+            job = await self._queue.get()
+            try:
+                await self._run(job)
+            finally:
+                self._queue.task_done()
+
+    @staticmethod
+    async def _run(job: ProcessingJob) -> None:
+        async with AsyncSessionLocal() as db:
+            service = VideoService(db)
+            try:
+                await service.process_video(
+                    video_id=job.video_id,
+                    camera_id=job.camera_id,
+                    location=job.location,
+                )
+            except Exception as e:
+                logger.error("Video processing failed", video_id=job.video_id, error=str(e))
+            except BaseException:
+                # Cancelled mid-pipeline (shutdown): process_video only
+                # handles Exception, so don't let PROCESSING stick.
+                logger.warning("Video processing interrupted", video_id=job.video_id)
+                await db.rollback()
+                await service.mark_interrupted(job.video_id)
+                await db.commit()
+                raise
+            # process_video records FAILED itself before re-raising.
+            await db.commit()
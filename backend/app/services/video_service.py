@@ -4,23 +4,164 @@ Video service for handling video upload, storage, and processing orchestration.
 
 import os
 import uuid
-import aiofiles
+import shutil
+import hashlib
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-from typing import Optional, List, Any
+from typing import Optional, List, Any, AsyncIterator, TYPE_CHECKING
 from pathlib import Path
 
-from sqlalchemy import select
+from sqlalchemy import select, insert, update, delete, func, tuple_
+from sqlalchemy.orm import noload, with_expression
 from sqlalchemy.ext.asyncio import AsyncSession
-from sqlalchemy.orm import selectinload
-from fastapi import UploadFile
+from streaming_form_data.targets import BaseTarget
 
 from app.config import get_settings, get_logger
 from app.models.video import Video, VideoSegment, ProcessingLog, ProcessingStatus
-from app.agents.video_processing_agent import VideoProcessingAgent, create_video_processing_agent
+
+if TYPE_CHECKING:
+    from app.agents.video_processing_agent import VideoProcessingAgent
 
 logger = get_logger("video_service")
 settings = get_settings()
 
+# Statuses from which a video may be (re)queued for processing.
+CLAIMABLE_STATUSES = (ProcessingStatus.PENDING, ProcessingStatus.FAILED)
+
+# Processing log statuses that also mark the step as finished.
+TERMINAL_LOG_STATUSES = frozenset({"completed", "failed"})
+
+# Statuses of a video that is queued or being processed.
+ACTIVE_STATUSES = frozenset({
+    ProcessingStatus.QUEUED,
+    ProcessingStatus.PROCESSING,
+    ProcessingStatus.SEGMENTING,
+    ProcessingStatus.EXTRACTING_AUDIO,
+    ProcessingStatus.GENERATING_THUMBNAILS,
+})
+
+# The agent pipeline is blocking (ffmpeg subprocesses, Bedrock calls) and the
+# agent itself is not picklable, so it runs on threads rather than processes.
+VIDEO_POOL = ThreadPoolExecutor(
+    max_workers=settings.video_worker_count,
+    thread_name_prefix="video-worker",
+)
+_worker_state = threading.local()
+
+
+def _worker_agent() -> "VideoProcessingAgent":
+    """
+    The calling pool thread's agent, created on first use and then reused.
+    
+    Building an agent sets up a Bedrock client, so it is worth keeping, but
+    the Strands agent holds conversation state and must not be shared
+    between concurrently running videos. One per worker thread gives both.
+    """
+    agent = getattr(_worker_state, "agent", None)
+    if agent is None:
+        # Imported here so strands/boto3 load on first use, not with the router.
+        from app.agents.video_processing_agent import create_video_processing_agent
+        
+        agent = _worker_state.agent = create_video_processing_agent()
+    return agent
+
+
+def _process_in_worker(**kwargs: Any) -> dict[str, Any]:
+    return _worker_agent().process_video(**kwargs)
+
+
+def allowed_extension(filename: Optional[str], allowed_extensions: frozenset[str]) -> Optional[str]:
+    """Lower-cased extension of ``filename`` if it is allowed, else None."""
+    _, dot, extension = (filename or "").rpartition(".")
+    extension = f".{extension.lower()}"
+    if not dot or extension not in allowed_extensions:
+        return None
+    return extension
+
+
+class VideoFileTarget(BaseTarget):
+    """
+    streaming_form_data target that writes the uploaded video straight to storage.
+    
+    The stored path is chosen when the part starts, once its filename is
+    known; parts with an unsupported extension are dropped without touching
+    the disk and flagged via ``rejected``. The callbacks do blocking file
+    I/O, so the parser feeding them should run off the event loop.
+    """
+    
+    def __init__(
+        self,
+        directory: Path,
+        allowed_extensions: frozenset[str],
+        write_buffer: int = 8 * 1024 * 1024,
+    ):
+        super().__init__()
+        self.directory = directory
+        self.allowed_extensions = allowed_extensions
+        self.write_buffer = write_buffer
+        self.video_id: Optional[str] = None
+        self.file_path: Optional[Path] = None
+        self.file_size = 0
+        self.rejected = False
+        self._fd = None
+        self._hasher = hashlib.blake2b(digest_size=16)
+    
+    def on_start(self) -> None:
+        extension = allowed_extension(self.multipart_filename, self.allowed_extensions)
+        if extension is None:
+            self.rejected = True
+            return
+        self.video_id = str(uuid.uuid4())
+        self.file_path = self.directory / f"{self.video_id}{extension}"
+        # The server hands the body over in small chunks; buffer them so the
+        # disk sees a few large writes instead.
+        self._fd = open(self.file_path, "wb", buffering=self.write_buffer)
+    
+    def on_data_received(self, chunk: bytes) -> None:
+        if self._fd is not None:
+            self._fd.write(chunk)
+            self._hasher.update(chunk)
+            self.file_size += len(chunk)
+    
+    def on_finish(self) -> None:
+        if self._fd is not None:
+            self._fd.close()
+            self._fd = None
+    
+    @property
+    def content_hash(self) -> str:
+        """Hex digest of everything written so far."""
+        return self._hasher.hexdigest()
+    
+    def discard(self) -> None:
+        """Close and delete a partially written file."""
+        self.on_finish()
+        if self.file_path is not None and self.file_path.exists():
+            self.file_path.unlink()
+
+
+def _safe_unlink(path: str) -> None:
+    """Remove a file, ignoring one that is already gone."""
+    try:
+        os.remove(path)
+    except FileNotFoundError:
+        pass
+
+
+def _remove_tree(path: Path) -> None:
+    """Remove a directory and everything in it, ignoring one that is already gone."""
+    shutil.rmtree(path, ignore_errors=True)
+
+
+def _replace_with_link(source: Path, target: Path) -> None:
+    """Atomically swap ``target`` for a hard link to ``source``."""
+    tmp = target.with_name(f".{target.name}.link")
+    os.link(source, tmp)
+    os.replace(tmp, target)
+
 
 class VideoService:
     """Service for video operations."""
@@ -33,27 +174,27 @@ class VideoService:
             db: Database session
         """
         self.db = db
-        self._agent: Optional[VideoProcessingAgent] = None
-    
-    @property
-    def agent(self) -> VideoProcessingAgent:
-        """Lazy-load the video processing agent."""
-        if self._agent is None:
-            self._agent = create_video_processing_agent()
-        return self._agent
     
     async def upload_video(
         self,
-        file: UploadFile,
+        video_id: str,
+        file_path: Path,
+        file_size: int,
+        original_filename: str,
+        content_hash: Optional[str] = None,
         camera_id: Optional[str] = None,
         location: Optional[str] = None,
         uploaded_by: Optional[str] = None,
     ) -> Video:
         """
-        Upload and store a video file.
+        Register a video file that has been written to storage.
         
         Args:
-            file: Uploaded file
+            video_id: ID the file was stored under
+            file_path: Path of the stored file
+            file_size: Size of the stored file in bytes
+            original_filename: Filename the client sent
+            content_hash: Digest of the file, if computed while storing it
             camera_id: Optional camera identifier
             location: Optional location description
             uploaded_by: Optional uploader identifier
@@ -61,47 +202,43 @@ class VideoService:
         Returns:
             Created Video model instance
         """
-        video_id = str(uuid.uuid4())
-        
-        file_extension = Path(file.filename).suffix.lower()
-        stored_filename = f"{video_id}{file_extension}"
-        file_path = settings.videos_dir / stored_filename
+        stored_filename = file_path.name
         
         logger.info(
             "Uploading video",
             video_id=video_id,
-            original_filename=file.filename,
+            original_filename=original_filename,
             stored_filename=stored_filename
         )
         
-        file_size = 0
-        async with aiofiles.open(file_path, "wb") as f:
-            while chunk := await file.read(1024 * 1024):
-                await f.write(chunk)
-                file_size += len(chunk)
-        
         video = Video(
             id=video_id,
             filename=stored_filename,
-            original_filename=file.filename,
+            original_filename=original_filename,
             file_path=str(file_path),
             file_size=file_size,
+            content_hash=content_hash,
             status=ProcessingStatus.PENDING,
             camera_id=camera_id,
             location=location,
             uploaded_by=uploaded_by,
         )
         
-        self.db.add(video)
-        await self.db.flush()
+        details = {"file_size": file_size, "stored_path": str(file_path)}
+        duplicate_of = content_hash and await self._dedupe_stored_file(content_hash, file_path)
+        if duplicate_of:
+            details["duplicate_of"] = duplicate_of
         
+        self.db.add(video)
         await self._log_processing_step(
             video_id=video_id,
             step="upload",
             status="completed",
-            message=f"Video uploaded successfully: {file.filename}",
-            details={"file_size": file_size, "stored_path": str(file_path)}
+            message=f"Video uploaded successfully: {original_filename}",
+            details=details
         )
+        # One flush writes both rows and fetches created_at for the response.
+        await self.db.flush()
         
         logger.info(
             "Video uploaded successfully",
@@ -111,6 +248,31 @@ class VideoService:
         
         return video
     
+    async def _dedupe_stored_file(self, content_hash: str, file_path: Path) -> Optional[str]:
+        """
+        Replace a freshly stored file with a hard link to an identical one.
+        
+        Each video keeps its own path, so deleting either copy later is safe.
+        
+        Returns:
+            ID of the video whose file was reused, if any
+        """
+        existing = (await self.db.execute(
+            select(Video.id, Video.file_path)
+            .where(Video.content_hash == content_hash)
+            .limit(1)
+        )).first()
+        if existing is None:
+            return None
+        
+        try:
+            await asyncio.to_thread(_replace_with_link, Path(existing.file_path), file_path)
+        except OSError as e:
+            # Different filesystem, missing original, etc. Keep the copy.
+            logger.warning("Could not link duplicate upload", video_id=existing.id, error=str(e))
+            return None
+        return existing.id
+    
     async def process_video(
         self,
         video_id: str,
@@ -120,6 +282,10 @@ class VideoService:
         """
         Process a video using the Video Processing Agent.
         
+        Commits the switch to PROCESSING (and its log entry) before the
+        pipeline starts, so pollers see it while the video is worked on; the
+        outcome is left in the session for the caller to commit.
+        
         Args:
             video_id: Video ID to process
             camera_id: Optional camera identifier (overrides stored value)
@@ -128,7 +294,13 @@ class VideoService:
         Returns:
             Processing result dictionary
         """
-        video = await self.get_video(video_id)
+        # Processing only writes segments and logs, so skip loading the
+        # existing ones.
+        video = await self.db.get(
+            Video,
+            video_id,
+            options=[noload(Video.segments), noload(Video.processing_logs)],
+        )
         if not video:
             raise ValueError(f"Video not found: {video_id}")
         
@@ -139,23 +311,32 @@ class VideoService:
         
         video.status = ProcessingStatus.PROCESSING
         video.processing_started_at = datetime.utcnow()
-        await self.db.flush()
         
         await self._log_processing_step(
             video_id=video_id,
             step="processing_start",
             status="started",
-            message="Video processing started"
+            message="Video processing started",
+            at=video.processing_started_at,
         )
         
+        await self.db.commit()
+        
         logger.info("Starting video processing", video_id=video_id)
         
         try:
-            result = self.agent.process_video(            # this is the main agent that is processing the video, which in turn is calling the tools to process the video. 
-                video_path=video.file_path,
-                video_id=video_id,
-                camera_id=video.camera_id,
-                location=video.location,
+            # this is the main agent that is processing the video, which in turn is calling the tools to process the video.
+            # It blocks for the whole pipeline, so it runs on the video pool
+            # while the event loop keeps serving requests.
+            result = await asyncio.get_running_loop().run_in_executor(
+                VIDEO_POOL,
+                functools.partial(
+                    _process_in_worker,
+                    video_path=video.file_path,
+                    video_id=video_id,
+                    camera_id=video.camera_id,
+                    location=video.location,
+                ),
             )
             
             if result.get("success"):
@@ -170,6 +351,7 @@ class VideoService:
                     step="processing_complete",
                     status="completed",
                     message="Video processing completed successfully",
+                    at=video.processing_completed_at,
                     details={
                         "processing_time_seconds": result.get("processing_time_seconds"),
                         "segment_count": result.get("segment_count", 0),
@@ -236,55 +418,38 @@ class VideoService:
         self,
         video_id: str,
         result: dict
-    ) -> List[VideoSegment]:
-        """Create VideoSegment records from processing result."""
-        segments = []
-        
-        output_dir = result.get("output_dir", "")
-        thumbnails_dir = result.get("thumbnails_dir", "")
-        
-        if output_dir and os.path.exists(output_dir):
-            segment_files = sorted([
-                f for f in os.listdir(output_dir)
-                if f.endswith(".mp4") and "_segment_" in f
-            ])
-            
-            for idx, seg_file in enumerate(segment_files):
-                segment_id = str(uuid.uuid4())
-                seg_path = os.path.join(output_dir, seg_file)
-                
-                thumb_path = None
-                thumb_file = f"{video_id}_segment_{idx:03d}_thumb.jpg"
-                potential_thumb = os.path.join(thumbnails_dir, thumb_file)
-                if os.path.exists(potential_thumb):
-                    thumb_path = potential_thumb
-                
-                file_size = os.path.getsize(seg_path) if os.path.exists(seg_path) else None
-                
-                segment = VideoSegment(
-                    id=segment_id,
-                    video_id=video_id,
-                    segment_index=idx,
-                    file_path=seg_path,
-                    thumbnail_path=thumb_path,
-                    start_time=idx * settings.segment_duration,
-                    end_time=(idx + 1) * settings.segment_duration,
-                    duration=settings.segment_duration,
-                    file_size=file_size,
-                )
-                
-                self.db.add(segment)
-                segments.append(segment)
-                
-                logger.debug(
-                    "Created segment record",
-                    video_id=video_id,
-                    segment_index=idx,
-                    segment_id=segment_id
-                )
+    ) -> int:
+        """
+        Create VideoSegment records from processing result.
         
-        await self.db.flush()
-        return segments
+        Timings and sizes come from the segment list ffmpeg wrote while
+        segmenting, so no files are re-scanned or re-probed here. All rows
+        go in with one executemany INSERT; IDs are generated client-side so
+        nothing needs to be read back.
+        
+        Returns:
+            Number of segment rows inserted
+        """
+        rows = [
+            {
+                "id": str(uuid.uuid4()),
+                "video_id": video_id,
+                "segment_index": seg["index"],
+                "file_path": seg["path"],
+                "thumbnail_path": seg.get("thumbnail_path"),
+                "start_time": seg["start_time"],
+                "end_time": seg["end_time"],
+                "duration": seg["duration"],
+                "file_size": seg.get("file_size"),
+            }
+            for seg in result.get("segments", [])
+        ]
+        
+        if rows:
+            await self.db.execute(insert(VideoSegment), rows)
+        
+        logger.debug("Created segment records", video_id=video_id, segment_count=len(rows))
+        return len(rows)
     
     async def _log_processing_step(
         self,
@@ -293,19 +458,29 @@ class VideoService:
         status: str,
         message: Optional[str] = None,
         details: Optional[dict] = None,
+        flush: bool = False,
+        at: Optional[datetime] = None,
     ) -> ProcessingLog:
-        """Log a processing step."""
+        """
+        Log a processing step.
+        
+        The row is only added to the session; it is written with the
+        caller's next flush unless ``flush`` is set. ``at`` lets a caller
+        that already took a timestamp for the step reuse it.
+        """
+        now = at or datetime.utcnow()
         log = ProcessingLog(
             video_id=video_id,
             step=step,
             status=status,
             message=message,
             details=details,
-            started_at=datetime.utcnow(),
-            completed_at=datetime.utcnow() if status in ["completed", "failed"] else None,
+            started_at=now,
+            completed_at=now if status in TERMINAL_LOG_STATUSES else None,
         )
         self.db.add(log)
-        await self.db.flush()
+        if flush:
+            await self.db.flush()
         return log
     
     async def get_video(self, video_id: str) -> Optional[Video]:
@@ -319,54 +494,200 @@ class VideoService:
             Video instance or None
         """
         result = await self.db.execute(
-            select(Video)
-            .options(
-                selectinload(Video.segments),
-                selectinload(Video.processing_logs)
-            )
+            select(Video).where(Video.id == video_id)
+        )
+        return result.scalar_one_or_none()
+    
+    async def try_claim_for_processing(self, video_id: str) -> bool:
+        """
+        Atomically move a video to QUEUED if it is waiting or has failed.
+        
+        A single UPDATE ... RETURNING both checks and claims, so concurrent
+        requests for the same video can't both queue it.
+        
+        Returns:
+            True if this call claimed the video
+        """
+        result = await self.db.execute(
+            update(Video)
+            .where(Video.id == video_id, Video.status.in_(CLAIMABLE_STATUSES))
+            .values(status=ProcessingStatus.QUEUED)
+            .returning(Video.id)
+            .execution_options(synchronize_session=False)
+        )
+        return result.scalar_one_or_none() is not None
+    
+    async def release_claim(self, video_id: str) -> None:
+        """Return a QUEUED video to PENDING when it couldn't be enqueued."""
+        await self.db.execute(
+            update(Video)
+            .where(Video.id == video_id, Video.status == ProcessingStatus.QUEUED)
+            .values(status=ProcessingStatus.PENDING)
+            .execution_options(synchronize_session=False)
+        )
+    
+    async def mark_interrupted(self, video_id: str, message: str = "Processing interrupted") -> None:
+        """Record a video whose processing was cut short as FAILED."""
+        await self.db.execute(
+            update(Video)
             .where(Video.id == video_id)
+            .values(status=ProcessingStatus.FAILED, error_message=message)
+            .execution_options(synchronize_session=False)
+        )
+        await self._log_processing_step(
+            video_id=video_id,
+            step="processing_error",
+            status="failed",
+            message=message,
+        )
+    
+    async def reset_interrupted(self) -> int:
+        """
+        Return videos left queued or mid-processing by a previous run to PENDING.
+        
+        The processing queue lives in memory, so after a restart nothing
+        would ever pick these up again, and /process refuses them. Only
+        safe while no other process is working on them; the API holds a
+        data directory lock for that.
+        
+        Returns:
+            Number of videos reset
+        """
+        result = await self.db.execute(
+            update(Video)
+            .where(Video.status.in_(ACTIVE_STATUSES))
+            .values(status=ProcessingStatus.PENDING)
+            .execution_options(synchronize_session=False)
+        )
+        return result.rowcount
+    
+    async def get_segment(self, video_id: str, segment_index: int) -> Optional[VideoSegment]:
+        """
+        Get one segment of a video by its index.
+        
+        Args:
+            video_id: Video ID
+            segment_index: Segment index (0-based)
+        
+        Returns:
+            VideoSegment instance or None
+        """
+        result = await self.db.execute(
+            select(VideoSegment).where(
+                VideoSegment.video_id == video_id,
+                VideoSegment.segment_index == segment_index,
+            )
         )
         return result.scalar_one_or_none()
     
+    async def get_video_status(self, video_id: str) -> Optional[ProcessingStatus]:
+        """
+        Get just a video's status, without loading the row or its relationships.
+        
+        Returns:
+            ProcessingStatus, or None if the video does not exist
+        """
+        result = await self.db.execute(select(Video.status).where(Video.id == video_id))
+        return result.scalar_one_or_none()
+    
     async def list_videos(
         self,
         page: int = 1,
         page_size: int = 20,
         status: Optional[ProcessingStatus] = None,
+        after: Optional[str] = None,
     ) -> tuple[List[Video], int]:
         """
-        List videos with pagination.
+        List videos with pagination, newest first.
+        
+        Segments and logs are not loaded; each video carries only its
+        segment_count, computed by a correlated subquery.
         
         Args:
-            page: Page number (1-indexed)
+            page: Page number (1-indexed), ignored when ``after`` is given
             page_size: Number of items per page
             status: Optional status filter
+            after: ID of the last video on the previous page; seeks straight
+                past it on the index instead of skipping rows with OFFSET
         
         Returns:
             Tuple of (videos list, total count)
+        
+        Raises:
+            ValueError: If ``after`` is not the ID of an existing video
         """
-        query = select(Video).options(
-            selectinload(Video.segments),
-            selectinload(Video.processing_logs)
-        )
+        query = self._summary_query(status)
         
+        count_query = select(func.count(Video.id))
         if status:
-            query = query.where(Video.status == status)
-        
-        count_result = await self.db.execute(
-            select(Video.id).where(Video.status == status) if status
-            else select(Video.id)
-        )
-        total = len(count_result.all())
-        
-        offset = (page - 1) * page_size
-        query = query.offset(offset).limit(page_size).order_by(Video.created_at.desc())
+            count_query = count_query.where(Video.status == status)
+        total = (await self.db.execute(count_query)).scalar_one()
+        
+        if after:
+            # An unknown anchor would silently yield an empty page.
+            anchor_exists = (await self.db.execute(
+                select(Video.id).where(Video.id == after)
+            )).first()
+            if anchor_exists is None:
+                raise ValueError(f"Unknown cursor: {after}")
+            # Compare against the anchor row's stored values rather than a
+            # decoded timestamp, so the database's own datetime format and
+            # precision are what get compared.
+            anchor = select(Video.created_at, Video.id).where(Video.id == after).subquery()
+            query = query.join(
+                anchor,
+                tuple_(Video.created_at, Video.id) < tuple_(anchor.c.created_at, anchor.c.id),
+            )
+        else:
+            query = query.offset((page - 1) * page_size)
+        # id breaks ties between videos created in the same second.
+        query = query.limit(page_size).order_by(Video.created_at.desc(), Video.id.desc())
         
         result = await self.db.execute(query)
         videos = result.scalars().all()
         
         return list(videos), total
     
+    async def stream_videos(
+        self,
+        status: Optional[ProcessingStatus] = None,
+    ) -> AsyncIterator[Video]:
+        """
+        Yield every video (newest first) as rows arrive from the database.
+        
+        Videos carry the same fields as list_videos; rows are fetched in
+        batches rather than materialized all at once.
+        
+        Args:
+            status: Optional status filter
+        """
+        query = (
+            self._summary_query(status)
+            .order_by(Video.created_at.desc(), Video.id.desc())
+            .execution_options(yield_per=100)
+        )
+        result = await self.db.stream_scalars(query)
+        async for video in result:
+            yield video
+    
+    @staticmethod
+    def _summary_query(status: Optional[ProcessingStatus] = None):
+        """Select videos with segment_count but without segments or logs."""
+        segment_count = (
+            select(func.count(VideoSegment.id))
+            .where(VideoSegment.video_id == Video.id)
+            .correlate(Video)
+            .scalar_subquery()
+        )
+        query = select(Video).options(
+            noload(Video.segments),
+            noload(Video.processing_logs),
+            with_expression(Video.segment_count, segment_count),
+        )
+        if status:
+            query = query.where(Video.status == status)
+        return query
+    
     async def delete_video(self, video_id: str) -> bool:
         """
         Delete a video and its associated files.
@@ -377,27 +698,50 @@ class VideoService:
         Returns:
             True if deleted, False if not found
         """
-        video = await self.get_video(video_id)
-        if not video:
+        # One round trip for every path to remove: the video's own file on
+        # each row, plus one row per segment (a single NULL-segment row if
+        # it has none).
+        rows = (
+            await self.db.execute(
+                select(
+                    Video.file_path,
+                    VideoSegment.file_path,
+                    VideoSegment.thumbnail_path,
+                    VideoSegment.audio_path,
+                )
+                .outerjoin(VideoSegment, VideoSegment.video_id == Video.id)
+                .where(Video.id == video_id)
+            )
+        ).all()
+        if not rows:
             return False
         
-        if os.path.exists(video.file_path):
-            os.remove(video.file_path)
-        
-        for segment in video.segments:
-            if segment.file_path and os.path.exists(segment.file_path):
-                os.remove(segment.file_path)
-            if segment.thumbnail_path and os.path.exists(segment.thumbnail_path):
-                os.remove(segment.thumbnail_path)
-            if segment.audio_path and os.path.exists(segment.audio_path):
-                os.remove(segment.audio_path)
+        paths = [
+            rows[0][0],
+            # The pipeline's extracted audio track has no row of its own.
+            str(settings.audio_dir / f"{video_id}_audio.aac"),
+            *(p for row in rows for p in row[1:] if p),
+        ]
+        # Unlinks block, so spread them over the default thread pool rather
+        # than holding up the event loop one syscall at a time.
+        await asyncio.gather(*(asyncio.to_thread(_safe_unlink, path) for path in paths))
+        # Whatever the pipeline left beside the segments (ffmpeg's segment
+        # list, thumbnails without a row) lives in the video's own output
+        # directories.
+        await asyncio.gather(
+            asyncio.to_thread(_remove_tree, settings.processed_dir / video_id),
+            asyncio.to_thread(_remove_tree, settings.thumbnails_dir / video_id),
+        )
         
-        await self.db.delete(video)
-        await self.db.flush()
+        # Segments and logs go with it via ON DELETE CASCADE.
+        await self.db.execute(delete(Video).where(Video.id == video_id))
         
         logger.info("Video deleted", video_id=video_id)
         return True
     
-    def get_agent_info(self) -> dict[str, Any]:
-        """Get information about the video processing agent."""
-        return self.agent.get_agent_info()
+    @classmethod
+    def get_agent_info(cls) -> dict[str, Any]:
+        """Get information about the video processing agent (needs no session)."""
+        from app.agents.video_processing_agent import agent_info
+        
+        return agent_info()